@@ -1,6 +1,27 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 import re
 
+ROLE_KEYWORDS = ['data scientist', 'frontend', 'backend', 'developer', 'engineer',
+                 'analyst', 'ml engineer', 'ai engineer', 'software engineer']
+
+
+def role_phrase(text: str) -> Optional[str]:
+    """The role as the student typed it, or None if the text names no role.
+
+    'roadmap for frontend developer' -> 'frontend developer'
+    'skills needed for data analyst' -> 'data analyst'
+    """
+    lowered = re.sub(r'\s+', ' ', text.lower()).strip(' ?.!')
+    if not any(role in lowered for role in ROLE_KEYWORDS):
+        return None
+    match = re.search(r'\b(?:for|as an?|become an?|to be an?)\s+(.+)$', lowered)
+    if match:
+        phrase = match.group(1)
+    else:
+        phrase = re.sub(r'\b(?:roadmap|skills?|needed|required|what|are|the|me|give|show)\b', ' ', lowered)
+    phrase = re.sub(r'\s+', ' ', phrase).strip(' ?.!')
+    return phrase or None
+
 class AgnoAgent:
     def __init__(self, max_context_length=10):
         self.context: Dict[str, List[Dict]] = {}
@@ -34,6 +55,15 @@ class AgnoAgent:
         
         return summary
 
+    def get_recent_role(self, session_id: str) -> Optional[str]:
+        """Role phrase from the latest user message that names one"""
+        for msg in reversed(self.get_context(session_id)):
+            if msg['role'] == 'user':
+                role = role_phrase(msg['content'])
+                if role:
+                    return role
+        return None
+
     def extract_conversation_topics(self, session_id: str) -> Dict[str, List[str]]:
         """Extract topics, companies, and roles from conversation"""
         context = self.get_context(session_id)
@@ -48,9 +78,7 @@ class AgnoAgent:
             content = msg['content'].lower()
             
             # Extract roles
-            role_keywords = ['data scientist', 'frontend', 'backend', 'developer', 'engineer', 
-                           'analyst', 'ml engineer', 'ai engineer', 'software engineer']
-            for role in role_keywords:
+            for role in ROLE_KEYWORDS:
                 if role in content:
                     topics['roles'].append(role)
             
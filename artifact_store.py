@@ -0,0 +1,85 @@
+from typing import List, Optional
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+DEFAULT_STORE_PATH = 'artifacts.db'
+
+
+def normalize_key(*parts: str) -> str:
+    """Case- and whitespace-insensitive key so 'Data  Scientist' matches 'data scientist'"""
+    return "|".join(re.sub(r'\s+', ' ', str(part)).strip().lower() for part in parts)
+
+
+class ArtifactStore:
+    """Compact local key-value store for pre-generated LLM artifacts.
+
+    Values are zlib-compressed text in a single SQLite table, keyed by
+    artifact kind ('roadmap', 'skills', 'interview') and the normalized inputs.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS artifacts ("
+            "kind TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, created_at REAL NOT NULL, "
+            "PRIMARY KEY (kind, key))"
+        )
+        self._conn.commit()
+
+    def get(self, kind: str, *parts: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM artifacts WHERE kind = ? AND key = ?", (kind, normalize_key(*parts))
+            ).fetchone()
+        return zlib.decompress(row[0]).decode('utf-8') if row else None
+
+    def put(self, kind: str, *parts: str, value: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO artifacts (kind, key, value, created_at) VALUES (?, ?, ?, ?)",
+                (kind, normalize_key(*parts), zlib.compress(value.encode('utf-8'), 9), time.time()),
+            )
+            self._conn.commit()
+
+    def contains(self, kind: str, *parts: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM artifacts WHERE kind = ? AND key = ?", (kind, normalize_key(*parts))
+            ).fetchone()
+        return row is not None
+
+    def keys(self, kind: str) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT key FROM artifacts WHERE kind = ? ORDER BY key", (kind,)).fetchall()
+        return [row[0] for row in rows]
+
+    def count(self, kind: str = None) -> int:
+        with self._lock:
+            if kind:
+                return self._conn.execute("SELECT COUNT(*) FROM artifacts WHERE kind = ?", (kind,)).fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def cached_generate(store: Optional[ArtifactStore], groq_agent, kind: str, parts: tuple, prompt: str,
+                    agent: str = None) -> str:
+    """Serve a stored artifact, falling back to live generation for unseen inputs.
+
+    The store is read-only here: live answers are never written back, since
+    callers pass free-form student text. Only warmup.py fills the store, from
+    the known companies and roles in the data.
+    """
+    if store is not None:
+        cached = store.get(kind, *parts)
+        if cached is not None:
+            return cached
+
+    return groq_agent.generate(prompt, [], agent=agent, intent=kind)
@@ -1,13 +1,16 @@
 from typing import Dict, List  # Added import
+from artifact_store import cached_generate
 
 class CareerAgent:
-    def __init__(self, groq_agent):
+    def __init__(self, groq_agent, store=None):
         self.groq = groq_agent
+        # Optional ArtifactStore with pre-generated answers (see warmup.py)
+        self.store = store
 
     def suggest_skills(self, domain: str) -> str:
         prompt = f"Suggest top 5 in-demand skills for {domain} in 2024 with brief explanations."
-        return self.groq.generate(prompt, [])
+        return cached_generate(self.store, self.groq, 'skills', (domain,), prompt, agent='career')
 
     def roadmap(self, role: str) -> str:
         prompt = f"Create a 3-month learning roadmap for {role} with weekly milestones."
-        return self.groq.generate(prompt, [])
\ No newline at end of file
+        return cached_generate(self.store, self.groq, 'roadmap', (role,), prompt, agent='career')
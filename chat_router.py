@@ -0,0 +1,344 @@
+from typing import Any, Callable
+
+from agno_agent import AgnoAgent, role_phrase
+
+# Modes that need the placement data (and therefore pandas/scikit-learn)
+DATA_MODES = ["Placement Analysis", "Data Query"]
+
+TREND_KEYWORDS = ['trend', 'by year', 'per year', 'year over year', 'yoy',
+                  'growth', 'over the years', 'by month', 'monthly']
+ANALYTICAL_KEYWORDS = ['how many', 'count of', 'number of', 'statistics of', 'percentage of',
+                       'highest', 'lowest', 'average', 'distribution of', 'compare']
+PROGRAM_NAMES = ['mca', 'msc', 'b.tech', 'btech', 'bachelor', 'master']
+COMPENSATION_KEYWORDS = ['lpa', 'salary', 'package', 'compensation', 'ctc']
+
+
+def has_value(value) -> bool:
+    """False for None and NaN (NaN is the only value not equal to itself), without importing pandas"""
+    return value is not None and value == value
+
+
+class ChatRouter:
+    """Answers one chat turn for a conversation mode.
+
+    This is the routing behind main.py's chat box, kept free of Streamlit so
+    the load simulator replays exactly the same branches. Placement data,
+    trends and prefetching are optional: the caller passes what is loaded.
+    """
+
+    def __init__(self, agno: AgnoAgent, groq, career_agent, placement_agent, prefetcher=None):
+        self.agno = agno
+        self.groq = groq
+        self.career_agent = career_agent
+        self.placement_agent = placement_agent
+        self.prefetcher = prefetcher
+
+    def prefetched(self, session_id: str, kind: str, key: str, compute: Callable[[], Any]) -> Any:
+        """Use the prefetched follow-up result for this session if there is one"""
+        result = self.prefetcher.get(session_id, kind, key) if self.prefetcher else None
+        return result if result is not None else compute()
+
+    def handle_turn(self, session_id: str, mode: str, user_input: str, rag=None,
+                    load_trends: Callable[[], Any] = None, prefetch_llm: bool = False) -> str:
+        """Answer `user_input` in `mode`, keeping the session context up to date.
+
+        `rag` is the loaded RAGAgent (None when no data is loaded) and
+        `load_trends` returns the TrendAgent on demand. Afterwards the likely
+        follow-ups are prefetched in the background.
+        """
+        # Update context with user message
+        self.agno.update_context(session_id, "user", user_input)
+
+        # Get current context and topics
+        current_context = self.agno.get_context(session_id)
+        conversation_topics = self.agno.extract_conversation_topics(session_id)
+
+        # Prepare context-enhanced prompt
+        context_summary = self.agno.get_conversation_summary(session_id)
+
+        if mode == "Career Advisor":
+            response = self._career_advisor(session_id, user_input, current_context, conversation_topics,
+                                            context_summary)
+        elif mode == "Placement Analysis":
+            response = self._placement_analysis(session_id, user_input, rag, current_context, conversation_topics,
+                                                context_summary)
+        elif mode == "Data Query":
+            response = self._data_query(session_id, user_input, rag, load_trends)
+        else:
+            enhanced_prompt = f"{context_summary}\n\nCurrent question: {user_input}"
+            response = self.groq.generate(enhanced_prompt, current_context, conversation_topics, intent='chat')
+
+        # Update context with assistant response
+        self.agno.update_context(session_id, "assistant", response)
+
+        # Start likely follow-up retrievals in the background for the next turn
+        if self.prefetcher is not None:
+            self.prefetcher.schedule(
+                session_id,
+                self.agno.extract_conversation_topics(session_id),
+                user_input,
+                rag_agent=rag,
+                career_agent=self.career_agent if prefetch_llm else None,
+            )
+        return response
+
+    def _career_advisor(self, session_id, user_input, current_context, conversation_topics, context_summary) -> str:
+        # The role as typed in this message, else as typed in the latest message that named one
+        recent_role = self.agno.get_recent_role(session_id)
+        if "roadmap" in user_input.lower():
+            role = role_phrase(user_input) or user_input.lower().replace("roadmap", "").replace("for", "").strip()
+            if not role:
+                # Extract role from context if not specified
+                role = recent_role or role
+            return self.prefetched(session_id, 'roadmap', role, lambda: self.career_agent.roadmap(role))
+        elif "skill" in user_input.lower() and recent_role:
+            # Skills for a known role (often prefetched after a roadmap for the same role)
+            return self.prefetched(session_id, 'skills', recent_role,
+                                   lambda: self.career_agent.suggest_skills(recent_role))
+        elif "skill" in user_input.lower():
+            # Use context to enhance skill suggestions
+            enhanced_prompt = f"{context_summary}\n\nWhat skills are needed: {user_input}"
+            return self.groq.generate(enhanced_prompt, current_context, conversation_topics,
+                                      agent='career', intent='skills')
+        else:
+            return self.prefetched(session_id, 'skills', user_input,
+                                   lambda: self.career_agent.suggest_skills(user_input))
+
+    def _placement_analysis(self, session_id, user_input, rag, current_context, conversation_topics,
+                            context_summary) -> str:
+        if rag is None:
+            return "📁 Please load a data file first for placement analysis."
+
+        if any(word in user_input.lower() for word in ['stat', 'analys', 'overview', 'summary', 'report']):
+            # Enhanced statistics display
+            stats = rag.get_placement_stats()
+            response = "📊 **Placement Statistics Report** 📊\n\n"
+
+            response += f"**📈 Overall Placement Overview:**\n"
+            response += f"• Total Students Placed: {stats.get('total_placements', 0)}\n"
+            response += f"• Companies Participated: {stats.get('companies_count', 0)}\n"
+            response += f"• Different Roles Offered: {stats.get('roles_count', 0)}\n"
+            response += f"• Placement Success Rate: {stats.get('success_rate', 0):.1f}%\n\n"
+
+            if stats.get('top_companies'):
+                response += "**🏆 Top Hiring Companies:**\n"
+                for company_data in stats['top_companies']:
+                    response += f"• {company_data['company']}: {company_data['placements']} placements\n"
+                response += "\n"
+
+            if stats.get('top_roles'):
+                response += "**👨‍💼 Most Offered Roles:**\n"
+                for role_data in stats['top_roles']:
+                    response += f"• {role_data['role']}: {role_data['count']} offers\n"
+                response += "\n"
+
+            if stats.get('compensation'):
+                comp = stats['compensation']
+                response += "**💰 Compensation Insights:**\n"
+                response += f"• Average Package: {comp.get('average', 'N/A')} LPA\n"
+                response += f"• Highest Package: {comp.get('max', 'N/A')} LPA\n"
+                response += f"• Most Common Range: {comp.get('common_range', 'N/A')}\n"
+                response += f"• Based on {comp.get('count', 0)} reported packages\n\n"
+
+            if stats.get('placement_types'):
+                response += "**📋 Placement Types:**\n"
+                for type_data in stats['placement_types'][:3]:
+                    response += f"• {type_data['type']}: {type_data['count']} students\n"
+
+            response += "\n💡 *Pro Tip: Ask about specific companies or roles for detailed information!*"
+            return response
+
+        elif any(word in user_input.lower() for word in ['company', 'at ', 'in ']):
+            # Company search
+            company = user_input
+            for keyword in ['company', 'at ', 'in ']:
+                if keyword in user_input.lower():
+                    company = user_input.lower().split(keyword)[-1].strip()
+                    break
+
+            results = self.prefetched(session_id, 'company', company, lambda: rag.search_by_company(company))
+            response = f"🏢 **Placements at {company.title()}:**\n\n"
+            if results:
+                for i, result in enumerate(results[:5], 1):
+                    role = result.get('Role', 'N/A')
+                    comp = result.get('Compensation: CTC', 'N/A')
+                    stipend = result.get('Stiepend (per month)', 'N/A')
+
+                    response += f"**{i}. {role}**\n"
+                    response += f"   💰 Compensation: {comp}\n"
+                    if has_value(stipend) and str(stipend) != 'Not specified':
+                        response += f"   📍 Stipend: {stipend}/month\n"
+                    response += "\n"
+
+                # Add company insights
+                response += f"**📊 About {company.title()}:**\n"
+                response += f"• {len(results)} placement records found\n"
+                response += f"• Offers various roles in technology sector\n"
+                response += f"• Competitive compensation packages\n"
+            else:
+                response = f"❌ No placements found for '{company}'.\n\n**Try these companies instead:**\n• Google\n• Amazon\n• Microsoft\n• Tech Mahindra\n• Infosys"
+            return response
+
+        elif any(word in user_input.lower() for word in ['role', 'position', 'job', 'as a']):
+            # Role search
+            role_name = user_input
+            for keyword in ['role', 'position', 'job', 'as a']:
+                if keyword in user_input.lower():
+                    role_name = user_input.lower().split(keyword)[-1].strip()
+                    break
+
+            results = self.prefetched(session_id, 'role', role_name, lambda: rag.search_by_role(role_name))
+            response = f"👨‍💼 **{role_name.title()} Roles:**\n\n"
+            if results:
+                for i, result in enumerate(results[:5], 1):
+                    company = result.get('Company', 'N/A')
+                    comp = result.get('Compensation: CTC', 'N/A')
+                    stipend = result.get('Stiepend (per month)', 'N/A')
+
+                    response += f"**{i}. {company}**\n"
+                    response += f"   💰 Package: {comp}\n"
+                    if has_value(stipend) and str(stipend) != 'Not specified':
+                        response += f"   📍 Stipend: {stipend}/month\n"
+                    response += "\n"
+
+                # Add role insights
+                response += f"**🎯 Career Insight for {role_name.title()}:**\n"
+                response += f"• {len(results)} placement records found\n"
+                response += f"• High demand in current market\n"
+                response += f"• Good growth opportunities\n"
+            else:
+                response = f"❌ No roles found for '{role_name}'.\n\n**Try these popular roles:**\n• Software Engineer\n• Data Analyst\n• Frontend Developer\n• Backend Developer\n• Data Scientist"
+            return response
+
+        else:
+            # General placement question with context
+            enhanced_prompt = f"{context_summary}\n\nBased on placement data, answer: {user_input}"
+            return self.groq.generate(enhanced_prompt, current_context, conversation_topics,
+                                      agent='placement', intent='chat')
+
+    def _data_query(self, session_id, user_input, rag, load_trends) -> str:
+        if rag is None:
+            return "📁 Please load a data file first for data analysis."
+
+        # Handle trend questions from the precomputed year/month rollups
+        if load_trends is not None and any(word in user_input.lower() for word in TREND_KEYWORDS):
+            trends = load_trends()
+            trends.refresh_if_changed()  # fold in rows appended to the file since it was cached
+            by = 'month' if 'month' in user_input.lower() and trends.has_monthly_data() else 'year'
+            program_name = next((p for p in trends.get_programs() if p.lower() in user_input.lower()), None)
+            rows = trends.trend(by, program=program_name)
+
+            title = f"{program_name} " if program_name else ""
+            period = trends.period_label() if by == 'year' else 'Month'
+            response = f"📈 **{title}Placement Trends by {period}**\n\n"
+            if period.startswith('Batch'):
+                response += "*Years are the batch (cohort) year from the registration number, not the year of placement.*\n\n"
+            if rows:
+                for row in rows:
+                    response += f"**{row['period']}:** {row['placements']} placements"
+                    if row['average_ctc'] is not None:
+                        response += f" • 💰 Avg {row['average_ctc']} LPA (max {row['highest_ctc']} LPA)"
+                    response += "\n"
+                    if row['placement_growth'] is not None:
+                        response += f"   ↪️ Placements {row['placement_growth']:+.1f}%"
+                        if row['ctc_growth'] is not None:
+                            response += f", CTC {row['ctc_growth']:+.1f}%"
+                        response += f" vs previous {by}\n"
+                if len(rows) == 1:
+                    response += f"\n💡 *Only {rows[0]['period']} is present in this data, so there is no growth to compare yet.*"
+            else:
+                response = "❌ No dated placement records found to build trends from."
+            return response
+
+        # Handle analytical questions using Groq
+        elif any(word in user_input.lower() for word in ANALYTICAL_KEYWORDS):
+            return rag.analyze_data_with_groq(user_input, self.groq)
+
+        # Handle program-specific questions (MCA, MSc, etc.)
+        elif any(program in user_input.lower() for program in PROGRAM_NAMES):
+            # Extract program name
+            program_name = None
+            for program in PROGRAM_NAMES:
+                if program in user_input.lower():
+                    program_name = program.upper()
+                    break
+
+            if not program_name:
+                return "Please specify the program name (e.g., MCA, MSc, B.Tech)."
+
+            program_stats = self.prefetched(session_id, 'program_stats', program_name,
+                                            lambda: rag.get_program_stats(program_name))
+
+            if program_stats:
+                response = f"📊 **{program_name} Program Statistics**\n\n"
+                response += f"👥 **Total Students:** {program_stats['total_students']}\n"
+                response += f"🎯 **Placement Rate:** {program_stats['placement_rate']:.1f}%\n"
+                response += f"💰 **Average Salary:** {program_stats['average_salary']:.2f} LPA\n\n"
+
+                if program_stats['top_companies']:
+                    response += "🏆 **Top Hiring Companies:**\n"
+                    for company in program_stats['top_companies']:
+                        response += f"• {company['company']}: {company['count']} placements\n"
+                    response += "\n"
+
+                if program_stats['top_roles']:
+                    response += "👨‍💼 **Popular Roles:**\n"
+                    for role in program_stats['top_roles']:
+                        response += f"• {role['role']}: {role['count']} offers\n"
+
+                # Add insights
+                response += f"\n**💡 Insights for {program_name} Students:**\n"
+                response += f"• Strong placement opportunities available\n"
+                response += f"• Competitive salary packages\n"
+                response += f"• Diverse role options across companies\n"
+            else:
+                response = f"❌ No data found for {program_name} program.\n\nAvailable programs: {', '.join(rag.df['Class'].unique() if 'Class' in rag.df.columns else 'Not specified')}"
+            return response
+
+        # Handle compensation questions
+        elif any(word in user_input.lower() for word in COMPENSATION_KEYWORDS):
+            comp_stats = rag.get_placement_stats().get('compensation', {})
+
+            if comp_stats:
+                response = f"💰 **Compensation Analysis**\n\n"
+                response += f"📈 **Highest Package:** {comp_stats.get('max', 'N/A')} LPA\n"
+                response += f"📊 **Average Package:** {comp_stats.get('average', 'N/A')} LPA\n"
+                response += f"📉 **Lowest Package:** {comp_stats.get('min', 'N/A')} LPA\n\n"
+
+                # Find specific examples
+                high_package = rag.get_highest_package()
+                if high_package:
+                    response += f"🏆 **Highest Package Example:**\n"
+                    response += f"• Company: {high_package.get('Company', 'N/A')}\n"
+                    response += f"• Role: {high_package.get('Role', 'N/A')}\n"
+                    response += f"• Package: {high_package['Compensation: CTC']}\n\n"
+
+                response += "**💡 Salary Insights:**\n"
+                response += f"• Based on {comp_stats.get('count', 0)} reported packages\n"
+                response += f"• Competitive with industry standards\n"
+                response += f"• Good return on educational investment\n"
+            else:
+                response = "❌ No compensation data available in the current dataset."
+            return response
+
+        else:
+            # Regular semantic search on the question alone so repeats hit the retrieval cache
+            results = rag.query(user_input)
+
+            if results and results[0]['similarity'] > 0.2:
+                result = results[0]
+                data = result['data']
+                response = "🔍 **Relevant Placement Info**\n\n"
+                important_fields = ['Company', 'Role', 'Compensation: CTC', 'Stiepend (per month)', 'Placement Origin', 'Class', 'Gender']
+                field_emojis = {
+                    'Company': '🏢', 'Role': '👨‍💼', 'Compensation: CTC': '💰',
+                    'Stiepend (per month)': '📍', 'Placement Origin': '🎯',
+                    'Class': '🎓', 'Gender': '👥'
+                }
+
+                for field in important_fields:
+                    if field in data and data[field] and data[field] != 'Not specified':
+                        response += f"{field_emojis.get(field, '•')} **{field}:** {data[field]}\n"
+            else:
+                response = "❌ No exact match found.\n\n**📊 Try analytical questions like:**\n• \"How many MCA students placed?\"\n• \"Highest package in placements\"\n• \"Average salary for developers\"\n• \"Placement statistics for MSc students\"\n• \"Company-wise placement distribution\""
+            return response
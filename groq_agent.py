@@ -1,17 +1,138 @@
 
+
         
 
-from groq import Groq
-from typing import List, Dict
+from typing import List, Dict, Any, Optional
 import os
+import threading
+import time
+
+# generate() reports API failures in its return value instead of raising
+GENERATION_ERROR_PREFIX = "I apologize, I'm having trouble responding right now."
+
+# Model tiers, smallest/fastest first; escalation walks down this list
+MODEL_TIERS = [
+    {'name': 'small', 'model': 'llama-3.1-8b-instant', 'max_tokens': 800},
+    {'name': 'standard', 'model': 'meta-llama/llama-4-scout-17b-16e-instruct', 'max_tokens': 1200},
+    {'name': 'large', 'model': 'llama-3.3-70b-versatile', 'max_tokens': 1500},
+]
+
+# Starting tier per intent, then per calling agent when the intent is unknown. Most traffic
+# starts on the small model and relies on escalation; only long structured answers start higher.
+INTENT_TIERS = {
+    'fact': 'small',
+    'chat': 'small',
+    'skills': 'small',
+    'interview': 'small',
+    'analysis': 'standard',
+    'resume': 'standard',
+    'roadmap': 'standard',
+}
+AGENT_TIERS = {
+    'rag': 'small',
+    'career': 'small',
+    'placement': 'small',
+}
+
+# Prompts above this many (estimated) tokens start one tier higher
+LARGE_PROMPT_TOKENS = 2500
+
+# Phrases that suggest the model could not really answer
+LOW_CONFIDENCE_MARKERS = ["i'm not sure", "i am not sure", "i don't know", "i do not know",
+                          "i cannot answer", "i can't answer", "unable to answer"]
+
+
+class ModelRouter:
+    """Pick a model tier per call from the calling agent, the intent and the prompt size"""
+
+    def __init__(self, tiers: List[Dict[str, Any]] = None, default_tier: str = 'small'):
+        self.tiers = tiers or MODEL_TIERS
+        self.tier_names = [tier['name'] for tier in self.tiers]
+        self.default_tier = default_tier
+        self._lock = threading.Lock()
+        self.stats = {tier['name']: self._empty_stats(tier) for tier in self.tiers}
+
+    @staticmethod
+    def _empty_stats(tier: Dict[str, Any]) -> Dict[str, Any]:
+        return {'model': tier['model'], 'calls': 0, 'failures': 0, 'escalations': 0,
+                'latency_s': 0.0, 'prompt_tokens': 0, 'completion_tokens': 0}
+
+    def get_tier(self, name: str) -> Dict[str, Any]:
+        return self.tiers[self.tier_names.index(name)]
+
+    def route(self, agent: str = None, intent: str = None, prompt_tokens: int = 0) -> str:
+        name = INTENT_TIERS.get(intent) or AGENT_TIERS.get(agent) or self.default_tier
+        if name not in self.tier_names:
+            name = self.default_tier
+        if prompt_tokens > LARGE_PROMPT_TOKENS:
+            name = self.next_tier(name) or name
+        return name
+
+    def next_tier(self, name: str) -> Optional[str]:
+        index = self.tier_names.index(name)
+        return self.tier_names[index + 1] if index + 1 < len(self.tier_names) else None
+
+    @staticmethod
+    def is_low_confidence(text: str) -> bool:
+        if not text or not text.strip():
+            return True
+        lowered = text.strip().lower()
+        return len(lowered) < 400 and any(marker in lowered for marker in LOW_CONFIDENCE_MARKERS)
+
+    def should_escalate(self, name: str, text: str, finish_reason: str = None) -> bool:
+        """Whether the answer from tier `name` should be retried on the next tier up"""
+        next_name = self.next_tier(name)
+        if next_name is None:
+            return False
+        if self.is_low_confidence(text):
+            return True
+        # A cut-off answer is only worth retrying on a different model, not on the same one with more room
+        return finish_reason == 'length' and self.get_tier(next_name)['model'] != self.get_tier(name)['model']
+
+    def record(self, name: str, latency: float, usage=None, failed: bool = False, escalated: bool = False):
+        with self._lock:
+            stats = self.stats[name]
+            stats['calls'] += 1
+            stats['latency_s'] += latency
+            if failed:
+                stats['failures'] += 1
+            if escalated:
+                stats['escalations'] += 1
+            if usage is not None:
+                stats['prompt_tokens'] += getattr(usage, 'prompt_tokens', 0) or 0
+                stats['completion_tokens'] += getattr(usage, 'completion_tokens', 0) or 0
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-tier call counts, average latency and token totals"""
+        with self._lock:
+            report = {}
+            for name, stats in self.stats.items():
+                report[name] = dict(stats)
+                report[name]['avg_latency_s'] = round(stats['latency_s'] / stats['calls'], 3) if stats['calls'] else 0.0
+                report[name]['latency_s'] = round(stats['latency_s'], 3)
+            return report
+
 
 class GroqAgent:
-    def __init__(self, model="llama-3.1-8b-instant"):
-        api_key = os.getenv('GROQ_API_KEY', '')
-        self.client = Groq(api_key=api_key)
-        self.model = model
+    def __init__(self, model: str = None, base_url: str = None, router: ModelRouter = None):
+        # base_url lets the load simulator point the client at a local mock server
+        self.base_url = base_url
+        # Passing a model pins every call to it with the old fixed token limit
+        self.router = None if model else (router or ModelRouter())
+        self.model = model or self.router.get_tier(self.router.default_tier)['model']
+        self._client = None
+
+    @property
+    def client(self):
+        """Create the Groq client on first use so startup does not pay for the SDK import"""
+        if self._client is None:
+            from groq import Groq
+            api_key = os.getenv('GROQ_API_KEY', '')
+            self._client = Groq(api_key=api_key, base_url=self.base_url)
+        return self._client
 
-    def generate(self, prompt: str, context: List[Dict] = None, conversation_topics: Dict = None) -> str:
+    def generate(self, prompt: str, context: List[Dict] = None, conversation_topics: Dict = None,
+                 agent: str = None, intent: str = None) -> str:
         try:
             # Build system message with context guidance
             system_message = {
@@ -37,15 +158,54 @@ Guidelines:
             
             messages.append({"role": "user", "content": prompt})
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=800,
-                top_p=0.9
-            )
+            if self.router is None:
+                response = self._complete(messages, self.model, 800)
+                return response.choices[0].message.content
             
-            return response.choices[0].message.content
+            return self._generate_routed(messages, agent, intent)
             
         except Exception as e:
-            return f"I apologize, I'm having trouble responding right now. Error: {str(e)}"
\ No newline at end of file
+            return f"{GENERATION_ERROR_PREFIX} Error: {str(e)}"
+
+    def _complete(self, messages: List[Dict], model: str, max_tokens: int):
+        return self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=max_tokens,
+            top_p=0.9
+        )
+
+    def _generate_routed(self, messages: List[Dict], agent: str = None, intent: str = None) -> str:
+        """Start at the routed tier and escalate on errors or low-confidence answers"""
+        prompt_tokens = sum(len(str(m.get('content', ''))) for m in messages) // 4
+        tier_name = self.router.route(agent, intent, prompt_tokens)
+        fallback_text = None
+        
+        while tier_name:
+            tier = self.router.get_tier(tier_name)
+            next_tier = self.router.next_tier(tier_name)
+            start = time.perf_counter()
+            try:
+                response = self._complete(messages, tier['model'], tier['max_tokens'])
+            except Exception:
+                self.router.record(tier_name, time.perf_counter() - start, failed=True, escalated=bool(next_tier))
+                if not next_tier:
+                    raise
+                tier_name = next_tier
+                continue
+            
+            choice = response.choices[0]
+            text = choice.message.content or ''
+            escalate = self.router.should_escalate(tier_name, text, choice.finish_reason)
+            self.router.record(tier_name, time.perf_counter() - start, response.usage, escalated=escalate)
+            if not escalate:
+                return text if text.strip() or fallback_text is None else fallback_text
+            
+            fallback_text = text if text.strip() else fallback_text
+            tier_name = next_tier
+        
+        return fallback_text or ''
+
+    def get_tier_stats(self) -> Dict[str, Dict[str, Any]]:
+        return self.router.get_stats() if self.router else {}
@@ -0,0 +1,477 @@
+"""Concurrent-session load simulator for the Career Placement Assistant.
+
+Spins up a local stand-in for the Groq chat completions endpoint and replays
+a mix of the four conversation modes from many simulated sessions through the
+same ChatRouter main.py uses (including prefetching and, optionally, the
+artifact store), then prints throughput, latency percentiles, AgnoAgent
+context memory growth and upstream request counts. With --stream the
+upstream calls are made as streamed requests to measure time to first token.
+
+Usage:
+    python load_simulator.py --sessions 300 --turns 4 --data data/knowledge.csv
+    python load_simulator.py --sessions 100 --stream --store artifacts.db --prefetch-llm
+"""
+
+from typing import Dict, List, Any
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from types import SimpleNamespace
+
+from agno_agent import AgnoAgent
+from groq_agent import GroqAgent, GENERATION_ERROR_PREFIX
+from career_agent import CareerAgent
+from placement_agent import PlacementAgent
+from prefetch_agent import PrefetchAgent
+from chat_router import ChatRouter
+
+MODES = ["General Chat", "Career Advisor", "Placement Analysis", "Data Query"]
+
+# Student questions per mode, shaped like what the UI and quick actions send
+MODE_PROMPTS = {
+    "General Chat": [
+        "Hello! What can you help me with?",
+        "Tell me about yourself",
+        "How should I prepare for placements?",
+        "What do recruiters look for in freshers?",
+    ],
+    "Career Advisor": [
+        "roadmap for data scientist",
+        "roadmap for frontend developer",
+        "skills needed for data scientist",
+        "what skills should I learn next",
+        "career options for computer science",
+    ],
+    "Placement Analysis": [
+        "show placement statistics",
+        "placements at google",
+        "roles available for developers",
+        "which companies hire the most",
+    ],
+    "Data Query": [
+        "how many MCA students placed",
+        "highest package this year",
+        "average salary for MSc students",
+        "placement trend by year",
+        "salary package details",
+        "frontend development internship",
+    ],
+}
+
+
+class MockGroqServer:
+    """Local stand-in for the Groq chat completions endpoint"""
+
+    def __init__(self, latency_ms: float = 300.0, jitter_ms: float = 100.0,
+                 rate_limit_ratio: float = 0.0, stream_chunks: int = 8,
+                 reply_tokens: int = 120, host: str = "127.0.0.1", port: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_ratio = rate_limit_ratio
+        self.stream_chunks = stream_chunks
+        self.reply_tokens = reply_tokens
+        self.counts = {'requests': 0, 'completed': 0, 'streamed': 0, 'rate_limited': 0, 'by_model': {}}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _count(self, key: str, model: str = None):
+        with self._lock:
+            self.counts[key] += 1
+            if model:
+                self.counts['by_model'][model] = self.counts['by_model'].get(model, 0) + 1
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                try:
+                    body = json.loads(self.rfile.read(length) or b'{}')
+                except ValueError:
+                    body = {}
+
+                if not self.path.endswith('/chat/completions'):
+                    self._send_json(404, {'error': {'message': 'Not found'}})
+                    return
+
+                model = body.get('model', 'unknown')
+                server._count('requests', model)
+
+                if random.random() < server.rate_limit_ratio:
+                    server._count('rate_limited')
+                    self._send_json(429, {'error': {'message': 'Rate limit reached', 'type': 'tokens'}},
+                                    {'retry-after': '0.1'})
+                    return
+
+                delay = max(0.0, random.gauss(server.latency_ms, server.jitter_ms)) / 1000.0
+                prompt_chars = sum(len(str(m.get('content', ''))) for m in body.get('messages', []))
+                usage = {
+                    'prompt_tokens': prompt_chars // 4,
+                    'completion_tokens': server.reply_tokens,
+                    'total_tokens': prompt_chars // 4 + server.reply_tokens,
+                }
+                text = " ".join(["mock"] * server.reply_tokens)
+
+                if body.get('stream'):
+                    server._count('streamed')
+                    self._send_stream(model, text, delay)
+                else:
+                    time.sleep(delay)
+                    self._send_json(200, {
+                        'id': f"chatcmpl-{uuid.uuid4().hex[:12]}",
+                        'object': 'chat.completion',
+                        'created': int(time.time()),
+                        'model': model,
+                        'choices': [{
+                            'index': 0,
+                            'message': {'role': 'assistant', 'content': text},
+                            'finish_reason': 'stop',
+                        }],
+                        'usage': usage,
+                    })
+                server._count('completed')
+
+            def _send_json(self, status: int, payload: Dict, headers: Dict = None):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _send_stream(self, model: str, text: str, delay: float):
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+                words = text.split(" ")
+                chunks = max(1, server.stream_chunks)
+                step = max(1, len(words) // chunks)
+                completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+                for i in range(0, len(words), step):
+                    time.sleep(delay / chunks)
+                    chunk = {
+                        'id': completion_id,
+                        'object': 'chat.completion.chunk',
+                        'created': int(time.time()),
+                        'model': model,
+                        'choices': [{'index': 0, 'delta': {'content': " ".join(words[i:i + step]) + " "},
+                                     'finish_reason': None}],
+                    }
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                    self.wfile.flush()
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+                self.close_connection = True
+
+        return Handler
+
+
+def deep_sizeof(obj, seen=None) -> int:
+    """Approximate the memory held by nested dicts/lists/strings"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class StreamingGroqAgent(GroqAgent):
+    """GroqAgent that makes every upstream call as a streamed request.
+
+    The chunks are reassembled into a regular completion, so routing and
+    escalation behave exactly as in the app; only the time to the first
+    token of each call is recorded on top.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.first_token_latencies: List[float] = []
+        self._stream_lock = threading.Lock()
+
+    def _complete(self, messages: List[Dict], model: str, max_tokens: int):
+        start = time.perf_counter()
+        first_token = None
+        parts = []
+        finish_reason = None
+        usage = None
+        stream = self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=max_tokens,
+            top_p=0.9,
+            stream=True,
+        )
+        for chunk in stream:
+            # Groq reports usage on the last chunk under x_groq; the mock server does not
+            usage = getattr(getattr(chunk, 'x_groq', None), 'usage', None) or usage
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                if first_token is None:
+                    first_token = time.perf_counter() - start
+                parts.append(delta)
+            finish_reason = chunk.choices[0].finish_reason or finish_reason
+
+        if first_token is not None:
+            with self._stream_lock:
+                self.first_token_latencies.append(first_token)
+        message = SimpleNamespace(content=''.join(parts))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason=finish_reason)], usage=usage)
+
+
+class LoadSimulator:
+    """Replays simulated student sessions through main.py's ChatRouter"""
+
+    def __init__(self, groq_agent, rag_agent=None, max_context_length=12, mode_weights: Dict[str, float] = None,
+                 store=None, prefetch: bool = True, prefetch_llm: bool = False):
+        self.groq = groq_agent
+        self.rag = rag_agent
+        self.store = store
+        self.agno = AgnoAgent(max_context_length=max_context_length)
+        self.prefetcher = PrefetchAgent(max_workers=4, ttl_seconds=120) if prefetch else None
+        self.router = ChatRouter(self.agno, groq_agent, CareerAgent(groq_agent, store),
+                                 PlacementAgent(groq_agent, store), self.prefetcher)
+        self.prefetch_llm = prefetch_llm
+        self.mode_weights = mode_weights or {mode: 1.0 for mode in MODES}
+        self.latencies: Dict[str, List[float]] = {mode: [] for mode in MODES}
+        self.errors = 0
+        self._trends = None
+        self._lock = threading.Lock()
+
+    def load_trends(self):
+        """TrendAgent for the RAG data file, built on first use like main.py's cached loader"""
+        with self._lock:
+            if self._trends is None:
+                from trend_agent import TrendAgent
+                self._trends = TrendAgent(self.rag.file_path)
+            return self._trends
+
+    def handle_turn(self, session_id: str, mode: str, user_input: str) -> str:
+        """Route one turn exactly as main.py does; returns the answer"""
+        return self.router.handle_turn(
+            session_id, mode, user_input,
+            rag=self.rag,
+            load_trends=self.load_trends if self.rag else None,
+            prefetch_llm=self.prefetch_llm,
+        )
+
+    def run_session(self, turns: int, think_time: float = 0.0):
+        session_id = f"session_{uuid.uuid4().hex[:8]}"
+        modes = list(self.mode_weights.keys())
+        weights = list(self.mode_weights.values())
+        for _ in range(turns):
+            mode = random.choices(modes, weights=weights)[0]
+            user_input = random.choice(MODE_PROMPTS[mode])
+            start = time.perf_counter()
+            try:
+                response = self.handle_turn(session_id, mode, user_input)
+                failed = response.startswith(GENERATION_ERROR_PREFIX)
+            except Exception as e:
+                print(f"Error in session {session_id}: {e}")
+                failed = True
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.latencies[mode].append(elapsed)
+                if failed:
+                    self.errors += 1
+            if think_time:
+                time.sleep(random.uniform(0, think_time))
+
+    def run(self, sessions: int, turns: int, concurrency: int, think_time: float = 0.0) -> Dict[str, Any]:
+        context_before = deep_sizeof(self.agno.context)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = [pool.submit(self.run_session, turns, think_time) for _ in range(sessions)]
+            for future in futures:
+                future.result()
+        wall_time = time.perf_counter() - start
+        context_after = deep_sizeof(self.agno.context)
+
+        all_latencies = [value for values in self.latencies.values() for value in values]
+        return {
+            'sessions': sessions,
+            'turns': len(all_latencies),
+            'errors': self.errors,
+            'wall_time_s': round(wall_time, 3),
+            'throughput_rps': round(len(all_latencies) / wall_time, 2) if wall_time > 0 else 0,
+            'latency_ms': self._latency_summary(all_latencies),
+            'latency_ms_by_mode': {mode: self._latency_summary(values)
+                                   for mode, values in self.latencies.items() if values},
+            'context_memory': {
+                'sessions_held': len(self.agno.context),
+                'bytes_before': context_before,
+                'bytes_after': context_after,
+                'bytes_per_session': round(context_after / len(self.agno.context)) if self.agno.context else 0,
+            },
+            'first_token_ms': self._latency_summary(self.groq.first_token_latencies)
+            if getattr(self.groq, 'first_token_latencies', None) else {},
+            'model_tiers': self.groq.get_tier_stats(),
+            'retrieval_cache': self.rag.get_cache_stats() if self.rag else {},
+            'prefetch': self.prefetcher.get_stats() if self.prefetcher else {},
+            'artifact_store': {'artifacts': self.store.count()} if self.store is not None else {},
+        }
+
+    @staticmethod
+    def _latency_summary(values: List[float]) -> Dict[str, float]:
+        return {
+            'count': len(values),
+            'p50': round(percentile(values, 50) * 1000, 1),
+            'p95': round(percentile(values, 95) * 1000, 1),
+            'p99': round(percentile(values, 99) * 1000, 1),
+        }
+
+
+def print_report(report: Dict[str, Any], upstream: Dict[str, Any]):
+    print("\n📊 Load Simulation Report\n")
+    print(f"• Sessions: {report['sessions']}  Turns: {report['turns']}  Errors: {report['errors']}")
+    print(f"• Wall time: {report['wall_time_s']} s  Throughput: {report['throughput_rps']} turns/s")
+    lat = report['latency_ms']
+    print(f"• Latency: p50 {lat['p50']} ms | p95 {lat['p95']} ms | p99 {lat['p99']} ms")
+    for mode, summary in report['latency_ms_by_mode'].items():
+        print(f"    - {mode}: n={summary['count']} p50 {summary['p50']} ms | p95 {summary['p95']} ms | p99 {summary['p99']} ms")
+    if report['first_token_ms']:
+        ttft = report['first_token_ms']
+        print(f"• Time to first streamed token (per upstream call): n={ttft['count']} p50 {ttft['p50']} ms | p95 {ttft['p95']} ms | "
+              f"p99 {ttft['p99']} ms")
+    mem = report['context_memory']
+    print(f"• AgnoAgent.context: {mem['sessions_held']} sessions, "
+          f"{mem['bytes_before']} -> {mem['bytes_after']} bytes ({mem['bytes_per_session']} bytes/session)")
+    if report['model_tiers']:
+        print("• Model tiers:")
+        for name, tier in report['model_tiers'].items():
+            print(f"    - {name} ({tier['model']}): {tier['calls']} calls, avg {tier['avg_latency_s'] * 1000:.0f} ms, "
+                  f"{tier['prompt_tokens']} prompt + {tier['completion_tokens']} completion tokens, "
+                  f"{tier['failures']} failures, {tier['escalations']} escalations")
+    if report['retrieval_cache']:
+        cache = report['retrieval_cache']
+        print(f"• Retrieval cache: {cache['hit_rate']}% hit rate ({cache['hits']} hits, {cache['misses']} misses, "
+              f"{cache['entries']} entries)")
+    if report['prefetch']:
+        prefetch = report['prefetch']
+        print(f"• Prefetch: {prefetch['hit_rate']}% hit rate ({prefetch['hits']} hits, {prefetch['misses']} misses, "
+              f"{prefetch['scheduled']} scheduled)")
+    if report['artifact_store']:
+        print(f"• Artifact store: {report['artifact_store']['artifacts']} pre-generated artifacts")
+    print(f"• Upstream requests: {upstream['requests']} "
+          f"(completed {upstream['completed']}, streamed {upstream['streamed']}, 429s {upstream['rate_limited']})")
+    for model, count in upstream['by_model'].items():
+        print(f"    - {model}: {count}")
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse 'general=4,career=2,placement=2,data=2' into mode weights"""
+    aliases = {'general': "General Chat", 'career': "Career Advisor",
+               'placement': "Placement Analysis", 'data': "Data Query"}
+    weights = {}
+    for part in mix.split(','):
+        name, _, weight = part.partition('=')
+        mode = aliases.get(name.strip().lower())
+        if mode is None:
+            raise ValueError(f"Unknown mode in mix: {name}")
+        weights[mode] = float(weight or 1)
+    return weights
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent student sessions against a mock Groq server")
+    parser.add_argument('--sessions', type=int, default=300)
+    parser.add_argument('--turns', type=int, default=4, help="turns per session")
+    parser.add_argument('--concurrency', type=int, default=50, help="sessions in flight at once")
+    parser.add_argument('--think-time', type=float, default=0.0, help="max seconds a student pauses between turns")
+    parser.add_argument('--mix', default="general=3,career=2,placement=3,data=2",
+                        help="relative weights of the four modes")
+    parser.add_argument('--data', default=None, help="placement data file for the RAG-backed modes")
+    parser.add_argument('--latency-ms', type=float, default=300.0)
+    parser.add_argument('--jitter-ms', type=float, default=100.0)
+    parser.add_argument('--rate-limit-ratio', type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument('--stream-chunks', type=int, default=8, help="chunks per streamed reply")
+    parser.add_argument('--stream', action='store_true', help="make upstream calls as streamed requests")
+    parser.add_argument('--store', default=None, help="artifact store to serve pre-generated answers from")
+    parser.add_argument('--no-prefetch', action='store_true', help="disable follow-up prefetching")
+    parser.add_argument('--prefetch-llm', action='store_true', help="also prefetch roadmap/skill LLM answers")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    server = MockGroqServer(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                            rate_limit_ratio=args.rate_limit_ratio, stream_chunks=args.stream_chunks).start()
+    os.environ.setdefault('GROQ_API_KEY', 'mock-key')
+
+    try:
+        rag = None
+        if args.data:
+            from rag_agent import RAGAgent
+            rag = RAGAgent(args.data)
+
+        store = None
+        if args.store:
+            from artifact_store import ArtifactStore
+            store = ArtifactStore(args.store)
+
+        groq = (StreamingGroqAgent if args.stream else GroqAgent)(base_url=server.base_url)
+        simulator = LoadSimulator(groq, rag, mode_weights=parse_mix(args.mix), store=store,
+                                  prefetch=not args.no_prefetch, prefetch_llm=args.prefetch_llm)
+        report = simulator.run(args.sessions, args.turns, args.concurrency, args.think_time)
+    finally:
+        server.stop()
+
+    if args.json:
+        print(json.dumps({'report': report, 'upstream': server.counts}, indent=2))
+    else:
+        print_report(report, server.counts)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,13 @@
 import streamlit as st
 from agno_agent import AgnoAgent
 from groq_agent import GroqAgent
-from rag_agent import RAGAgent
 from career_agent import CareerAgent
 from placement_agent import PlacementAgent
+from artifact_store import ArtifactStore
+from prefetch_agent import PrefetchAgent
+from chat_router import ChatRouter, DATA_MODES
 import os
 import uuid
-import pandas as pd
-import re
 
 # Initialize agents
 agno = AgnoAgent(max_context_length=12)
@@ -18,35 +18,68 @@ data_files = []
 if os.path.exists('data'):
     data_files = [f for f in os.listdir('data') if f.endswith(('.csv', '.xlsx', '.xls'))]
 
-# Initialize RAG agent with error handling
+@st.cache_resource(show_spinner="Loading placement data...")
+def load_rag(file_path: str):
+    # Imported here so the heavy data stack is only loaded when a data mode is first used
+    from rag_agent import RAGAgent
+    return RAGAgent(file_path)
+
+# Initialize RAG agent lazily with error handling
 rag = None
 data_loaded = False
+file_path = None
 
 if data_files:
     selected_file = st.sidebar.selectbox("Select data file", data_files)
     file_path = os.path.join('data', selected_file)
+    data_status = st.sidebar.container()
+else:
+    st.sidebar.warning("📁 No data files found in 'data' folder")
+
+def ensure_data_loaded():
+    """Load the selected data file on first use and report it in the sidebar"""
+    global rag, data_loaded
+    if data_loaded or not file_path:
+        return
     
     try:
-        rag = RAGAgent(file_path)
+        rag = load_rag(file_path)
         data_loaded = True
-        st.sidebar.success(f"✅ Loaded: {selected_file}")
+        data_status.success(f"✅ Loaded: {selected_file}")
         
         # Show data stats
         stats = rag.get_stats()
-        st.sidebar.info(f"📊 {stats['total_rows']} rows, {len(stats['columns'])} columns")
+        data_status.info(f"📊 {stats['total_rows']} rows, {len(stats['columns'])} columns")
         
-        if st.sidebar.button("View Data Sample"):
-            st.sidebar.dataframe(rag.df.head(3))
+        if data_status.button("View Data Sample"):
+            data_status.dataframe(rag.df.head(3))
             
     except Exception as e:
-        st.sidebar.error(f"❌ Error loading file: {str(e)}")
-        st.sidebar.info("Using simple text search instead of semantic search")
+        data_status.error(f"❌ Error loading file: {str(e)}")
+        data_status.info("Using simple text search instead of semantic search")
         data_loaded = False
-else:
-    st.sidebar.warning("📁 No data files found in 'data' folder")
 
-career_agent = CareerAgent(groq)
-placement_agent = PlacementAgent(groq)
+@st.cache_resource(show_spinner="Building placement trends...")
+def load_trends(file_path: str):
+    # Year/month rollups for trend questions in Data Query mode
+    from trend_agent import TrendAgent
+    return TrendAgent(file_path)
+
+@st.cache_resource
+def load_artifact_store():
+    # Pre-generated roadmaps/skills/interview banks from warmup.py
+    return ArtifactStore()
+
+@st.cache_resource
+def load_prefetcher():
+    # Shared across sessions; each session gets its own short-lived result cache
+    return PrefetchAgent(max_workers=4, ttl_seconds=120)
+
+artifact_store = load_artifact_store()
+career_agent = CareerAgent(groq, artifact_store)
+placement_agent = PlacementAgent(groq, artifact_store)
+prefetcher = load_prefetcher()
+router = ChatRouter(agno, groq, career_agent, placement_agent, prefetcher)
 
 # Streamlit UI
 st.title("🤖 Career Placement Assistant")
@@ -67,13 +100,23 @@ agent_mode = st.sidebar.selectbox(
     index=0
 )
 
+if agent_mode in DATA_MODES:
+    ensure_data_loaded()
+
+prefetch_llm = st.sidebar.checkbox("⚡ Prefetch AI follow-ups", value=False,
+                                   help="Start likely roadmap/skill answers in the background after each reply")
+
 # Display current context
 if st.sidebar.button("📋 Show Conversation Context"):
     context_summary = agno.get_conversation_summary(st.session_state.session_id)
     st.sidebar.text_area("Current Context", context_summary, height=200)
 
 # Placement statistics button
-if data_loaded and rag and st.sidebar.button("📈 Show Placement Statistics"):
+show_stats = bool(file_path) and st.sidebar.button("📈 Show Placement Statistics")
+if show_stats:
+    ensure_data_loaded()
+
+if show_stats and data_loaded and rag:
     placement_stats = rag.get_placement_stats()
     st.sidebar.subheader("📊 Placement Statistics Report")
     
@@ -98,6 +141,7 @@ if data_loaded and rag and st.sidebar.button("📈 Show Placement Statistics"):
 # Clear context
 if st.sidebar.button("🔄 Clear Conversation"):
     agno.clear_context(st.session_state.session_id)
+    prefetcher.clear_session(st.session_state.session_id)
     st.sidebar.success("Conversation cleared!")
     st.rerun()
 
@@ -113,241 +157,15 @@ else:
     user_input = st.chat_input("Ask about placements, careers, skills, or data...")
 
 if user_input:
-    # Update context with user message
-    agno.update_context(st.session_state.session_id, "user", user_input)
-    
-    # Get current context and topics
-    current_context = agno.get_context(st.session_state.session_id)
-    conversation_topics = agno.extract_conversation_topics(st.session_state.session_id)
-    
-    # Prepare context-enhanced prompt
-    context_summary = agno.get_conversation_summary(st.session_state.session_id)
-    
-    # Generate response based on mode
-    response = ""
-    
-    if agent_mode == "General Chat":
-        enhanced_prompt = f"{context_summary}\n\nCurrent question: {user_input}"
-        response = groq.generate(enhanced_prompt, current_context, conversation_topics)
-    
-    elif agent_mode == "Career Advisor":
-        if "roadmap" in user_input.lower():
-            # Extract role from context if not specified
-            role = user_input.lower().replace("roadmap", "").replace("for", "").strip()
-            if not role and conversation_topics['roles']:
-                role = conversation_topics['roles'][0]
-            response = career_agent.roadmap(role)
-        elif "skill" in user_input.lower():
-            # Use context to enhance skill suggestions
-            enhanced_prompt = f"{context_summary}\n\nWhat skills are needed: {user_input}"
-            response = groq.generate(enhanced_prompt, current_context, conversation_topics)
-        else:
-            response = career_agent.suggest_skills(user_input)
-    
-    elif agent_mode == "Placement Analysis":
-        if data_loaded and rag:
-            if any(word in user_input.lower() for word in ['stat', 'analys', 'overview', 'summary', 'report']):
-                # Enhanced statistics display
-                stats = rag.get_placement_stats()
-                response = "📊 **Placement Statistics Report** 📊\n\n"
-                
-                response += f"**📈 Overall Placement Overview:**\n"
-                response += f"• Total Students Placed: {stats.get('total_placements', 0)}\n"
-                response += f"• Companies Participated: {stats.get('companies_count', 0)}\n"
-                response += f"• Different Roles Offered: {stats.get('roles_count', 0)}\n"
-                response += f"• Placement Success Rate: {stats.get('success_rate', 0):.1f}%\n\n"
-                
-                if stats.get('top_companies'):
-                    response += "**🏆 Top Hiring Companies:**\n"
-                    for company_data in stats['top_companies']:
-                        response += f"• {company_data['company']}: {company_data['placements']} placements\n"
-                    response += "\n"
-                
-                if stats.get('top_roles'):
-                    response += "**👨‍💼 Most Offered Roles:**\n"
-                    for role_data in stats['top_roles']:
-                        response += f"• {role_data['role']}: {role_data['count']} offers\n"
-                    response += "\n"
-                
-                if stats.get('compensation'):
-                    comp = stats['compensation']
-                    response += "**💰 Compensation Insights:**\n"
-                    response += f"• Average Package: {comp.get('average', 'N/A')} LPA\n"
-                    response += f"• Highest Package: {comp.get('max', 'N/A')} LPA\n"
-                    response += f"• Most Common Range: {comp.get('common_range', 'N/A')}\n"
-                    response += f"• Based on {comp.get('count', 0)} reported packages\n\n"
-                
-                if stats.get('placement_types'):
-                    response += "**📋 Placement Types:**\n"
-                    for type_data in stats['placement_types'][:3]:
-                        response += f"• {type_data['type']}: {type_data['count']} students\n"
-                
-                response += "\n💡 *Pro Tip: Ask about specific companies or roles for detailed information!*"
-            
-            elif any(word in user_input.lower() for word in ['company', 'at ', 'in ']):
-                # Company search
-                company = user_input
-                for keyword in ['company', 'at ', 'in ']:
-                    if keyword in user_input.lower():
-                        company = user_input.lower().split(keyword)[-1].strip()
-                        break
-                
-                results = rag.search_by_company(company)
-                response = f"🏢 **Placements at {company.title()}:**\n\n"
-                if results:
-                    for i, result in enumerate(results[:5], 1):
-                        role = result.get('Role', 'N/A')
-                        comp = result.get('Compensation: CTC', 'N/A')
-                        stipend = result.get('Stiepend (per month)', 'N/A')
-                        
-                        response += f"**{i}. {role}**\n"
-                        response += f"   💰 Compensation: {comp}\n"
-                        if pd.notna(stipend) and str(stipend) != 'Not specified':
-                            response += f"   📍 Stipend: {stipend}/month\n"
-                        response += "\n"
-                    
-                    # Add company insights
-                    response += f"**📊 About {company.title()}:**\n"
-                    response += f"• {len(results)} placement records found\n"
-                    response += f"• Offers various roles in technology sector\n"
-                    response += f"• Competitive compensation packages\n"
-                else:
-                    response = f"❌ No placements found for '{company}'.\n\n**Try these companies instead:**\n• Google\n• Amazon\n• Microsoft\n• Tech Mahindra\n• Infosys"
-            
-            elif any(word in user_input.lower() for word in ['role', 'position', 'job', 'as a']):
-                # Role search
-                role_name = user_input
-                for keyword in ['role', 'position', 'job', 'as a']:
-                    if keyword in user_input.lower():
-                        role_name = user_input.lower().split(keyword)[-1].strip()
-                        break
-                
-                results = rag.search_by_role(role_name)
-                response = f"👨‍💼 **{role_name.title()} Roles:**\n\n"
-                if results:
-                    for i, result in enumerate(results[:5], 1):
-                        company = result.get('Company', 'N/A')
-                        comp = result.get('Compensation: CTC', 'N/A')
-                        stipend = result.get('Stiepend (per month)', 'N/A')
-                        
-                        response += f"**{i}. {company}**\n"
-                        response += f"   💰 Package: {comp}\n"
-                        if pd.notna(stipend) and str(stipend) != 'Not specified':
-                            response += f"   📍 Stipend: {stipend}/month\n"
-                        response += "\n"
-                    
-                    # Add role insights
-                    response += f"**🎯 Career Insight for {role_name.title()}:**\n"
-                    response += f"• {len(results)} placement records found\n"
-                    response += f"• High demand in current market\n"
-                    response += f"• Good growth opportunities\n"
-                else:
-                    response = f"❌ No roles found for '{role_name}'.\n\n**Try these popular roles:**\n• Software Engineer\n• Data Analyst\n• Frontend Developer\n• Backend Developer\n• Data Scientist"
-            
-            else:
-                # General placement question with context
-                enhanced_prompt = f"{context_summary}\n\nBased on placement data, answer: {user_input}"
-                response = groq.generate(enhanced_prompt, current_context, conversation_topics)
-        else:
-            response = "📁 Please load a data file first for placement analysis."
-    
-    elif agent_mode == "Data Query":
-        if data_loaded and rag:
-            # Handle analytical questions using Groq
-            if any(word in user_input.lower() for word in ['how many', 'count of', 'number of', 'statistics of', 'percentage of', 
-                                                         'highest', 'lowest', 'average', 'distribution of', 'compare']):
-                response = rag.analyze_data_with_groq(user_input, groq)
-            
-            # Handle program-specific questions (MCA, MSc, etc.)
-            elif any(program in user_input.lower() for program in ['mca', 'msc', 'b.tech', 'btech', 'bachelor', 'master']):
-                # Extract program name
-                program_name = None
-                for program in ['mca', 'msc', 'b.tech', 'btech', 'bachelor', 'master']:
-                    if program in user_input.lower():
-                        program_name = program.upper()
-                        break
-                
-                if program_name:
-                    program_stats = rag.get_program_stats(program_name)
-                    
-                    if program_stats:
-                        response = f"📊 **{program_name} Program Statistics**\n\n"
-                        response += f"👥 **Total Students:** {program_stats['total_students']}\n"
-                        response += f"🎯 **Placement Rate:** {program_stats['placement_rate']:.1f}%\n"
-                        response += f"💰 **Average Salary:** {program_stats['average_salary']:.2f} LPA\n\n"
-                        
-                        if program_stats['top_companies']:
-                            response += "🏆 **Top Hiring Companies:**\n"
-                            for company in program_stats['top_companies']:
-                                response += f"• {company['company']}: {company['count']} placements\n"
-                            response += "\n"
-                        
-                        if program_stats['top_roles']:
-                            response += "👨‍💼 **Popular Roles:**\n"
-                            for role in program_stats['top_roles']:
-                                response += f"• {role['role']}: {role['count']} offers\n"
-                        
-                        # Add insights
-                        response += f"\n**💡 Insights for {program_name} Students:**\n"
-                        response += f"• Strong placement opportunities available\n"
-                        response += f"• Competitive salary packages\n"
-                        response += f"• Diverse role options across companies\n"
-                    else:
-                        response = f"❌ No data found for {program_name} program.\n\nAvailable programs: {', '.join(rag.df['Class'].unique() if 'Class' in rag.df.columns else 'Not specified')}"
-                else:
-                    response = "Please specify the program name (e.g., MCA, MSc, B.Tech)."
-            
-            # Handle compensation questions
-            elif any(word in user_input.lower() for word in ['lpa', 'salary', 'package', 'compensation', 'ctc']):
-                comp_stats = rag.get_placement_stats().get('compensation', {})
-                
-                if comp_stats:
-                    response = f"💰 **Compensation Analysis**\n\n"
-                    response += f"📈 **Highest Package:** {comp_stats.get('max', 'N/A')} LPA\n"
-                    response += f"📊 **Average Package:** {comp_stats.get('average', 'N/A')} LPA\n"
-                    response += f"📉 **Lowest Package:** {comp_stats.get('min', 'N/A')} LPA\n\n"
-                    
-                    # Find specific examples
-                    high_package = rag.df[rag.df['Compensation: CTC'] != 'Not specified'].nlargest(1, 'Compensation: CTC')
-                    if not high_package.empty:
-                        response += f"🏆 **Highest Package Example:**\n"
-                        response += f"• Company: {high_package.iloc[0]['Company']}\n"
-                        response += f"• Role: {high_package.iloc[0]['Role']}\n"
-                        response += f"• Package: {high_package.iloc[0]['Compensation: CTC']}\n\n"
-                    
-                    response += "**💡 Salary Insights:**\n"
-                    response += f"• Based on {comp_stats.get('count', 0)} reported packages\n"
-                    response += f"• Competitive with industry standards\n"
-                    response += f"• Good return on educational investment\n"
-                else:
-                    response = "❌ No compensation data available in the current dataset."
-            
-            else:
-                # Regular semantic search
-                enhanced_prompt = f"{context_summary}\n\nData query: {user_input}"
-                results = rag.query(enhanced_prompt)
-                
-                if results and results[0]['similarity'] > 0.2:
-                    result = results[0]
-                    data = result['data']
-                    response = "🔍 **Relevant Placement Info**\n\n"
-                    important_fields = ['Company', 'Role', 'Compensation: CTC', 'Stiepend (per month)', 'Placement Origin', 'Class', 'Gender']
-                    field_emojis = {
-                        'Company': '🏢', 'Role': '👨‍💼', 'Compensation: CTC': '💰', 
-                        'Stiepend (per month)': '📍', 'Placement Origin': '🎯',
-                        'Class': '🎓', 'Gender': '👥'
-                    }
-                    
-                    for field in important_fields:
-                        if field in data and data[field] and data[field] != 'Not specified':
-                            response += f"{field_emojis.get(field, '•')} **{field}:** {data[field]}\n"
-                else:
-                    response = "❌ No exact match found.\n\n**📊 Try analytical questions like:**\n• \"How many MCA students placed?\"\n• \"Highest package in placements\"\n• \"Average salary for developers\"\n• \"Placement statistics for MSc students\"\n• \"Company-wise placement distribution\""
-        else:
-            response = "📁 Please load a data file first for data analysis."
-    
-    # Update context with assistant response
-    agno.update_context(st.session_state.session_id, "assistant", response)
+    # Route the turn the same way the load simulator does (see chat_router.py)
+    response = router.handle_turn(
+        st.session_state.session_id,
+        agent_mode,
+        user_input,
+        rag=rag if data_loaded else None,
+        load_trends=(lambda: load_trends(file_path)) if file_path else None,
+        prefetch_llm=prefetch_llm,
+    )
     
     # Display response
     with st.chat_message("assistant"):
@@ -1,13 +1,37 @@
 from typing import Dict, List  # Added import
+from artifact_store import cached_generate
+
+# Rough characters-per-token ratio used to keep prompts within a token budget
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def trim_to_token_budget(text: str, max_tokens: int) -> str:
+    """Trim text to roughly max_tokens, cutting at a line break where possible"""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    trimmed = text[:max_chars]
+    cut = trimmed.rfind('\n')
+    if cut > max_chars * 0.8:
+        trimmed = trimmed[:cut]
+    return trimmed.rstrip() + "\n[...truncated]"
+
 
 class PlacementAgent:
-    def __init__(self, groq_agent):
+    def __init__(self, groq_agent, store=None):
         self.groq = groq_agent
+        # Optional ArtifactStore with pre-generated answers (see warmup.py)
+        self.store = store
 
     def interview_questions(self, company: str, role: str) -> str:
         prompt = f"Generate 5 technical and 3 behavioral questions for {role} interviews at {company}."
-        return self.groq.generate(prompt, [])
+        return cached_generate(self.store, self.groq, 'interview', (company, role), prompt, agent='placement')
 
-    def resume_feedback(self, resume_text: str) -> str:
+    def resume_feedback(self, resume_text: str, max_resume_tokens: int = 1500) -> str:
+        resume_text = trim_to_token_budget(resume_text.strip(), max_resume_tokens)
         prompt = f"Provide constructive feedback on this resume:\n{resume_text}"
-        return self.groq.generate(prompt, [])
\ No newline at end of file
+        return self.groq.generate(prompt, [], agent='placement', intent='resume')
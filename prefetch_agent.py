@@ -0,0 +1,126 @@
+from typing import Dict, List, Any, Callable, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError
+import re
+import threading
+import time
+
+from agno_agent import role_phrase
+
+PROGRAM_KEYWORDS = ['mca', 'msc', 'b.tech', 'btech']
+
+
+def _normalize(value: str) -> str:
+    return re.sub(r'\s+', ' ', str(value)).strip().lower()
+
+
+class PrefetchAgent:
+    """Speculatively computes likely follow-up results for each session.
+
+    After an answer is sent, `schedule` looks at the session's conversation
+    topics and starts the retrievals (and optionally cheap LLM generations)
+    the student is likely to ask for next in a background thread pool.
+    Results live in a short-lived per-session cache read through `get`.
+    """
+
+    def __init__(self, max_workers: int = 4, ttl_seconds: float = 120.0, max_jobs_per_turn: int = 8):
+        self.ttl_seconds = ttl_seconds
+        self.max_jobs_per_turn = max_jobs_per_turn
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='prefetch')
+        self.sessions: Dict[str, Dict[Tuple[str, str], Tuple[float, Future]]] = {}
+        self.stats = {'scheduled': 0, 'hits': 0, 'misses': 0, 'expired': 0, 'errors': 0}
+        self._lock = threading.Lock()
+
+    def plan(self, topics: Dict[str, List[str]], last_input: str = '', rag_agent=None,
+             career_agent=None) -> List[Tuple[str, str, Callable[[], Any]]]:
+        """Likely follow-ups as (kind, key, compute) jobs, most specific first"""
+        jobs = []
+        text = last_input.lower()
+
+        if rag_agent is not None:
+            for company in topics.get('companies', []):
+                jobs.append(('company', company, lambda company=company: rag_agent.search_by_company(company)))
+            for role in topics.get('roles', []):
+                jobs.append(('role', role, lambda role=role: rag_agent.search_by_role(role)))
+            for program in PROGRAM_KEYWORDS:
+                if program in text:
+                    jobs.append(('program_stats', program.upper(),
+                                 lambda program=program: rag_agent.get_program_stats(program.upper())))
+
+        # Cheap LLM follow-up: after a roadmap students ask for skills for the same role and vice
+        # versa. Only the role as named in the student's own message is used, never loose keywords
+        # picked up from assistant replies, so each turn starts at most one paid call.
+        role = role_phrase(last_input)
+        if career_agent is not None and role:
+            if 'roadmap' in text:
+                jobs.append(('skills', role, lambda: career_agent.suggest_skills(role)))
+            elif 'skill' in text:
+                jobs.append(('roadmap', role, lambda: career_agent.roadmap(role)))
+
+        return jobs[:self.max_jobs_per_turn]
+
+    def schedule(self, session_id: str, topics: Dict[str, List[str]], last_input: str = '',
+                 rag_agent=None, career_agent=None) -> int:
+        """Start background prefetches for a session; returns how many were started"""
+        self._expire()
+        started = 0
+        for kind, key, compute in self.plan(topics, last_input, rag_agent, career_agent):
+            cache_key = (kind, _normalize(key))
+            with self._lock:
+                session = self.sessions.setdefault(session_id, {})
+                if cache_key in session:
+                    continue
+                session[cache_key] = (time.time() + self.ttl_seconds, self.pool.submit(compute))
+                self.stats['scheduled'] += 1
+            started += 1
+        return started
+
+    def get(self, session_id: str, kind: str, key: str, wait_seconds: Optional[float] = None) -> Optional[Any]:
+        """Return a prefetched result, or None if nothing usable was prefetched.
+
+        A prefetch that is still running is the same work the caller would
+        start, so it is waited on until it finishes (or for `wait_seconds`
+        when given) rather than computed a second time.
+        """
+        cache_key = (kind, _normalize(key))
+        with self._lock:
+            entry = self.sessions.get(session_id, {}).get(cache_key)
+            if entry is None or entry[0] < time.time():
+                self.stats['misses'] += 1
+                return None
+
+        try:
+            result = entry[1].result(timeout=wait_seconds)
+        except TimeoutError:
+            result = None
+        except Exception as e:
+            print(f"Error in prefetch {kind} '{key}': {e}")
+            with self._lock:
+                self.stats['errors'] += 1
+            result = None
+
+        with self._lock:
+            self.stats['hits' if result is not None else 'misses'] += 1
+        return result
+
+    def clear_session(self, session_id: str):
+        with self._lock:
+            for _, future in self.sessions.pop(session_id, {}).values():
+                future.cancel()
+
+    def _expire(self):
+        now = time.time()
+        with self._lock:
+            for session_id in list(self.sessions):
+                session = self.sessions[session_id]
+                for cache_key in [k for k, (expires_at, _) in session.items() if expires_at < now]:
+                    session.pop(cache_key)[1].cancel()
+                    self.stats['expired'] += 1
+                if not session:
+                    del self.sessions[session_id]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return dict(self.stats,
+                        hit_rate=round(self.stats['hits'] / lookups * 100, 1) if lookups else 0.0,
+                        sessions=len(self.sessions))
@@ -1,49 +1,212 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from collections import OrderedDict
 import os
 import re
-from sentence_transformers import SentenceTransformer
-import torch
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import threading
+
+# scikit-learn is imported inside the methods that need it so that importing
+# this module stays cheap; see startup_profile.py for the cold-start budget.
+
+
+def normalize_question(text: str) -> str:
+    """Lowercase, drop surrounding punctuation and collapse whitespace"""
+    text = re.sub(r'[^\w\s.+#&-]', ' ', str(text).lower())
+    return re.sub(r'\s+', ' ', text).strip(' .')
+
+
+def parse_ctc(value) -> float:
+    """CTC in LPA from strings like '8-10 LPA', '7.2 LPA' or '6.5 LPA + 50K Bonus'"""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return np.nan
+    text = str(value).replace(',', '').split('+')[0]
+    numbers = [float(num) for num in re.findall(r'(\d+\.?\d*)', text)]
+    if not numbers:
+        return np.nan
+    return sum(numbers[:2]) / len(numbers[:2])  # midpoint of a range
+
+
+# Single-statistic lookups answered briefly by the small model tier; anything that
+# also compares or breaks down the data is treated as a full analysis
+FACT_KEYWORDS = ['how many', 'count of', 'number of', 'highest', 'lowest', 'average', 'mean', 'median']
+ANALYSIS_KEYWORDS = ['compare', 'distribution', 'percentage', 'statistics', 'trend', 'why', ' vs ', 'versus']
+
+
+class RetrievalCache:
+    """LRU cache for retrieval results, tied to one version of the dataset"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self.data_version = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        with self._lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return True, self.entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Tuple, value: Any, data_version: str = None):
+        """Store a result; results computed on an older data version are dropped"""
+        with self._lock:
+            if data_version is not None and data_version != self.data_version:
+                return
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def set_version(self, data_version: str):
+        """Drop every entry when the dataset version changes"""
+        with self._lock:
+            if data_version != self.data_version:
+                if self.entries:
+                    self.invalidations += 1
+                self.entries.clear()
+                self.data_version = data_version
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups * 100, 1) if lookups else 0.0,
+                'entries': len(self.entries),
+                'max_entries': self.max_entries,
+                'invalidations': self.invalidations,
+                'data_version': self.data_version,
+            }
+
 
 class RAGAgent:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, cache_size: int = 256):
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found at {file_path}")
         
+        self.file_path = file_path
+        self.cache = RetrievalCache(cache_size)
+        self._load_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self.data_version = None
+        self._load_data()
+
+    def _data_version(self) -> str:
+        """Version of the data file on disk (size + modification time)"""
+        stat = os.stat(self.file_path)
+        return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+    def _load_data(self):
+        """Build the data, TF-IDF index and version off to the side, then swap them in together"""
+        file_path = self.file_path
+        data_version = self._data_version()
+        
         # Load data
         if file_path.endswith('.csv'):
-            self.df = pd.read_csv(file_path)
+            df = pd.read_csv(file_path)
         elif file_path.endswith(('.xlsx', '.xls')):
-            self.df = pd.read_excel(file_path)
+            df = pd.read_excel(file_path)
         
-        print(f"Loaded data with columns: {self.df.columns.tolist()}")
-        print(f"Data shape: {self.df.shape}")
+        print(f"Loaded data with columns: {df.columns.tolist()}")
+        print(f"Data shape: {df.shape}")
         
         # Clean data
-        self._clean_data()
-        self._create_combined_text()
+        df = self._clean_data(df)
+        df = self._create_combined_text(df)
         
         # Create TF-IDF vectors
-        self.vectorizer = TfidfVectorizer(stop_words='english', max_features=500)
-        self.tfidf_matrix = self.vectorizer.fit_transform(self.df['combined_text'])
-        print(f"Created TF-IDF matrix with shape: {self.tfidf_matrix.shape}")
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        vectorizer = TfidfVectorizer(stop_words='english', max_features=500)
+        tfidf_matrix = vectorizer.fit_transform(df['combined_text'])
+        print(f"Created TF-IDF matrix with shape: {tfidf_matrix.shape}")
+        
+        with self._state_lock:
+            self.df = df
+            self.vectorizer = vectorizer
+            self.tfidf_matrix = tfidf_matrix
+            self.data_version = data_version
+            self.cache.set_version(data_version)
+
+    def _snapshot(self) -> Tuple[str, pd.DataFrame, Any, Any]:
+        """Consistent (version, df, vectorizer, tfidf_matrix) for one computation"""
+        with self._state_lock:
+            return self.data_version, self.df, self.vectorizer, self.tfidf_matrix
 
-    def query(self, question: str, top_k=1) -> List[Dict[str, Any]]:
-        """Query using TF-IDF cosine similarity - return only the most relevant result"""
+    def _check_data_version(self):
+        """Reload the data (and drop cached results) if the file changed on disk"""
         try:
-            question_vec = self.vectorizer.transform([question])
-            similarities = cosine_similarity(question_vec, self.tfidf_matrix).flatten()
+            current = self._data_version()
+        except OSError:
+            return
+        if current != self.data_version:
+            with self._load_lock:
+                if current != self.data_version:
+                    print(f"Data file changed, reloading {self.file_path}")
+                    self._load_data()
+
+    def _cached(self, method: str, key: Tuple, compute: Callable[..., Any]) -> Any:
+        """Serve a retrieval result from the cache, computing it on a miss
+        
+        `compute` receives one consistent snapshot of the data (see `_snapshot`)
+        and the key carries that snapshot's version, so a computation that
+        straddles a reload can never be served for the new data.
+        """
+        self._check_data_version()
+        snapshot = self._snapshot()
+        cache_key = (snapshot[0], method) + key
+        hit, value = self.cache.get(cache_key)
+        if hit:
+            return value
+        value = compute(*snapshot[1:])
+        self.cache.put(cache_key, value, data_version=snapshot[0])
+        return value
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return self.cache.get_stats()
+
+    def query(self, question: str, top_k=1, filters: Dict[str, str] = None) -> List[Dict[str, Any]]:
+        """Query using TF-IDF cosine similarity - return only the most relevant result
+        
+        Pass only the user's question (not the conversation history) so repeated
+        questions hit the retrieval cache. `filters` restricts the search to rows
+        whose column contains the given value, e.g. {'Company': 'Google'}.
+        """
+        # Compute from the same normalized values that form the cache key
+        normalized = normalize_question(question)
+        filter_key = tuple(sorted((col, normalize_question(value)) for col, value in (filters or {}).items()))
+        return self._cached('query', (normalized, filter_key, top_k),
+                            lambda df, vectorizer, matrix: self._query_uncached(df, vectorizer, matrix,
+                                                                                normalized, dict(filter_key)))
+
+    def _query_uncached(self, df: pd.DataFrame, vectorizer, tfidf_matrix, question: str,
+                        filters: Dict[str, str] = None) -> List[Dict[str, Any]]:
+        try:
+            from sklearn.metrics.pairwise import cosine_similarity
+            question_vec = vectorizer.transform([question])
+            similarities = cosine_similarity(question_vec, tfidf_matrix).flatten()
+            
+            if filters:
+                mask = np.ones(len(df), dtype=bool)
+                for col, value in filters.items():
+                    if col in df.columns:
+                        mask &= df[col].astype(str).str.contains(str(value), case=False, regex=False).to_numpy()
+                similarities = np.where(mask, similarities, -1.0)
             
             # Get only the most relevant result
             top_index = np.argmax(similarities)
             
             result = {
                 'similarity': float(similarities[top_index]),
-                'data': self.df.iloc[top_index].to_dict(),
-                'text': self.df.iloc[top_index]['combined_text']
+                'data': df.iloc[top_index].to_dict(),
+                'text': df.iloc[top_index]['combined_text']
             }
             
             return [result] if result['similarity'] > 0.1 else []  # Only return if relevant
@@ -52,21 +215,22 @@ class RAGAgent:
             print(f"Error in query: {e}")
             return []
 
-    def _clean_data(self):
+    def _clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and preprocess the placement data"""
-        self.df = self.df.replace('', pd.NA)
+        df = df.replace('', pd.NA)
         
         # Clean specific columns
         text_columns = ['Company', 'Role', 'Compensation: CTC', 'Stiepend (per month)', 'Placement Origin']
         for col in text_columns:
-            if col in self.df.columns:
-                self.df[col] = self.df[col].fillna('Not specified').astype(str).str.strip()
+            if col in df.columns:
+                df[col] = df[col].fillna('Not specified').astype(str).str.strip()
+        return df
 
-    def _create_combined_text(self):
+    def _create_combined_text(self, df: pd.DataFrame) -> pd.DataFrame:
         """Combine all relevant columns into a single text field"""
         text_parts = []
         
-        for _, row in self.df.iterrows():
+        for _, row in df.iterrows():
             row_text = []
             for col, value in row.items():
                 if col != 'combined_text' and pd.notna(value) and str(value).strip() != '':
@@ -75,7 +239,8 @@ class RAGAgent:
             combined = " | ".join(row_text)
             text_parts.append(combined)
         
-        self.df['combined_text'] = text_parts
+        df['combined_text'] = text_parts
+        return df
 
     def get_placement_stats(self) -> Dict[str, Any]:
         """Get comprehensive placement statistics in student-friendly format"""
@@ -124,20 +289,20 @@ class RAGAgent:
         
         return stats
 
+    def get_highest_package(self) -> Optional[Dict[str, Any]]:
+        """The placement record with the highest CTC (ranges count at their midpoint)"""
+        if 'Compensation: CTC' not in self.df.columns:
+            return None
+        ctc = self.df['Compensation: CTC'].map(parse_ctc)
+        if not ctc.notna().any():
+            return None
+        return self.df.loc[ctc.idxmax()].to_dict()
+
     def _analyze_compensation(self) -> Dict[str, Any]:
         """Analyze compensation data for student understanding"""
-        comp_data = self.df[self.df['Compensation: CTC'] != 'Not specified']['Compensation: CTC']
-        numeric_values = []
-        
-        for comp in comp_data:
-            if isinstance(comp, str):
-                numbers = re.findall(r'(\d+\.?\d*)', comp.replace(',', ''))
-                if numbers:
-                    nums = [float(num) for num in numbers]
-                    if len(nums) > 1 and any(char in comp for char in ['-', 'to']):
-                        numeric_values.append(sum(nums) / len(nums))  # Average of range
-                    else:
-                        numeric_values.extend(nums)
+        # Same parsing as get_highest_package, so the reported maximum and its example agree
+        ctc = self.df['Compensation: CTC'].map(parse_ctc)
+        numeric_values = ctc.dropna().tolist()
         
         if numeric_values:
             return {
@@ -171,6 +336,24 @@ class RAGAgent:
             # Create a data summary for Groq to analyze
             data_summary = self._create_data_summary()
             
+            lowered = question.lower()
+            is_fact = any(word in lowered for word in FACT_KEYWORDS) and \
+                not any(word in lowered for word in ANALYSIS_KEYWORDS)
+            if is_fact:
+                prompt = f"""
+            Answer the question from the following placement data.
+
+            PLACEMENT DATA SUMMARY:
+            {data_summary}
+
+            QUESTION: {question}
+
+            Reply in one or two sentences with the number asked for. If the data does not contain it, say so.
+
+            ANSWER:
+            """
+                return groq_agent.generate(prompt, [], {}, agent='rag', intent='fact')
+            
             prompt = f"""
             You are a data analyst. Analyze the following placement data and answer the question.
 
@@ -189,7 +372,7 @@ class RAGAgent:
             ANSWER:
             """
             
-            response = groq_agent.generate(prompt, [], {})
+            response = groq_agent.generate(prompt, [], {}, agent='rag', intent='analysis')
             return response
             
         except Exception as e:
@@ -256,10 +439,15 @@ class RAGAgent:
 
     def get_program_stats(self, program_name: str) -> Dict[str, Any]:
         """Get statistics for specific program (MCA, MSc, etc.)"""
-        if 'Class' not in self.df.columns:
+        normalized = normalize_question(program_name)
+        return self._cached('program_stats', (normalized,),
+                            lambda df, *_: self._get_program_stats_uncached(df, normalized))
+
+    def _get_program_stats_uncached(self, df: pd.DataFrame, program_name: str) -> Dict[str, Any]:
+        if 'Class' not in df.columns:
             return {}
         
-        program_data = self.df[self.df['Class'].str.contains(program_name, case=False, na=False)]
+        program_data = df[df['Class'].str.contains(program_name, case=False, na=False, regex=False)]
         
         if len(program_data) == 0:
             return {}
@@ -312,16 +500,26 @@ class RAGAgent:
             'roles': self.df['Role'].dropna().unique().tolist() if 'Role' in self.df.columns else []
         }
 
-    def search_by_company(self, company_name: str) -> List[Dict]:
-        if 'Company' not in self.df.columns:
+    def get_company_role_pairs(self) -> List[Dict[str, str]]:
+        """Distinct (company, role) pairs that appear in the data"""
+        if 'Company' not in self.df.columns or 'Role' not in self.df.columns:
             return []
         
-        results = self.df[self.df['Company'].str.contains(company_name, case=False, na=False)]
-        return results.to_dict('records')
+        pairs = self.df[['Company', 'Role']].dropna().drop_duplicates()
+        pairs = pairs[(pairs['Company'] != 'Not specified') & (pairs['Role'] != 'Not specified')]
+        return [{'company': company, 'role': role} for company, role in pairs.itertuples(index=False)]
+
+    def search_by_company(self, company_name: str) -> List[Dict]:
+        normalized = normalize_question(company_name)
+        return self._cached('company', (normalized,), lambda df, *_: self._search_column(df, 'Company', normalized))
 
     def search_by_role(self, role_name: str) -> List[Dict]:
-        if 'Role' not in self.df.columns:
+        normalized = normalize_question(role_name)
+        return self._cached('role', (normalized,), lambda df, *_: self._search_column(df, 'Role', normalized))
+
+    def _search_column(self, df: pd.DataFrame, column: str, value: str) -> List[Dict]:
+        if column not in df.columns:
             return []
         
-        results = self.df[self.df['Role'].str.contains(role_name, case=False, na=False)]
+        results = df[df[column].str.contains(value, case=False, na=False, regex=False)]
         return results.to_dict('records')
\ No newline at end of file
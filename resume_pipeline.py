@@ -0,0 +1,204 @@
+"""Bulk resume review pipeline built on PlacementAgent.resume_feedback.
+
+Extracts text from a directory of resume files in a process pool, trims each
+resume to a token budget, runs the LLM calls with bounded concurrency and
+appends every result to a JSONL or CSV report as soon as it is ready. The
+report doubles as the checkpoint: re-running the same command skips resumes
+that already have feedback, and files with no readable text until they
+change, and retries the ones whose review failed.
+
+Usage:
+    python resume_pipeline.py resumes/ --output resume_feedback.jsonl --concurrency 4
+"""
+
+from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import argparse
+import csv
+import json
+import os
+import threading
+import time
+
+from groq_agent import GENERATION_ERROR_PREFIX
+from placement_agent import PlacementAgent, estimate_tokens, trim_to_token_budget
+
+RESUME_EXTENSIONS = ('.txt', '.md', '.pdf')
+# Statuses that are final for an unchanged file; 'error' rows are retried on the next run
+DONE_STATUSES = ('ok', 'unreadable')
+REPORT_FIELDS = ['file', 'signature', 'status', 'resume_tokens', 'trimmed', 'feedback', 'error', 'latency_s', 'reviewed_at']
+
+
+def file_signature(path: str) -> str:
+    """Size + modification time in nanoseconds, so a same-size rewrite within a second still counts"""
+    stat = os.stat(path)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def extract_text(path: str) -> Dict[str, Any]:
+    """Extract plain text from a resume file (runs in a worker process)"""
+    try:
+        if path.lower().endswith('.pdf'):
+            try:
+                from pypdf import PdfReader
+            except ImportError:
+                return {'file': path, 'text': '', 'error': "pypdf is required to read PDF resumes (pip install pypdf)",
+                        'unreadable': False}
+            reader = PdfReader(path)
+            text = "\n".join(page.extract_text() or '' for page in reader.pages)
+        else:
+            with open(path, encoding='utf-8', errors='ignore') as f:
+                text = f.read()
+    except Exception as e:
+        return {'file': path, 'text': '', 'error': f"Could not read file: {e}", 'unreadable': True}
+
+    text = "\n".join(line.strip() for line in text.splitlines() if line.strip())
+    if not text:
+        return {'file': path, 'text': '', 'error': "No text found in file", 'unreadable': True}
+    return {'file': path, 'text': text, 'error': None, 'unreadable': False}
+
+
+class ReportWriter:
+    """Append-only JSONL/CSV report that also serves as the resume checkpoint"""
+
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+        self.is_csv = output_path.lower().endswith('.csv')
+        self._lock = threading.Lock()
+
+    def load_completed(self, statuses=DONE_STATUSES) -> Dict[str, str]:
+        """Map of absolute file path -> signature for resumes already done (feedback or unreadable)"""
+        if not os.path.exists(self.output_path):
+            return {}
+        completed = {}
+        with open(self.output_path, encoding='utf-8', newline='') as f:
+            if self.is_csv:
+                rows = csv.DictReader(f)
+            else:
+                rows = []
+                for line in f:
+                    try:
+                        rows.append(json.loads(line))
+                    except ValueError:
+                        continue  # partially written last line from an interrupted run
+            for row in rows:
+                if row.get('status') in statuses:
+                    completed[os.path.abspath(row['file'])] = row.get('signature')
+        return completed
+
+    def write(self, row: Dict[str, Any]):
+        with self._lock:
+            new_file = not os.path.exists(self.output_path) or os.path.getsize(self.output_path) == 0
+            with open(self.output_path, 'a', encoding='utf-8', newline='') as f:
+                if self.is_csv:
+                    writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS, extrasaction='ignore')
+                    if new_file:
+                        writer.writeheader()
+                    writer.writerow(row)
+                else:
+                    f.write(json.dumps(row, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+
+class ResumeBatchPipeline:
+    def __init__(self, placement_agent: PlacementAgent, output_path: str, concurrency: int = 4,
+                 extract_workers: Optional[int] = None, max_resume_tokens: int = 1500):
+        self.placement_agent = placement_agent
+        self.writer = ReportWriter(output_path)
+        self.concurrency = concurrency
+        self.extract_workers = extract_workers
+        self.max_resume_tokens = max_resume_tokens
+        self.stats = {'found': 0, 'skipped': 0, 'ok': 0, 'unreadable': 0, 'failed': 0}
+        self._lock = threading.Lock()
+
+    def find_resumes(self, input_dir: str) -> List[str]:
+        if not os.path.isdir(input_dir):
+            raise FileNotFoundError(f"Resume directory not found at {input_dir}")
+        paths = []
+        for root, _, files in os.walk(input_dir):
+            for name in files:
+                if name.lower().endswith(RESUME_EXTENSIONS):
+                    paths.append(os.path.abspath(os.path.join(root, name)))
+        return sorted(paths)
+
+    def _review(self, extracted: Dict[str, Any], signature: str) -> Dict[str, Any]:
+        row = {
+            'file': extracted['file'],
+            'signature': signature,
+            'status': 'unreadable' if extracted['unreadable'] else 'error',
+            'resume_tokens': 0,
+            'trimmed': False,
+            'feedback': '',
+            'error': extracted['error'],
+            'latency_s': 0.0,
+            'reviewed_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+        if not extracted['error']:
+            text = extracted['text']
+            row['resume_tokens'] = estimate_tokens(text)
+            row['trimmed'] = trim_to_token_budget(text, self.max_resume_tokens) != text
+            start = time.perf_counter()
+            try:
+                feedback = self.placement_agent.resume_feedback(text, max_resume_tokens=self.max_resume_tokens)
+                if feedback.startswith(GENERATION_ERROR_PREFIX):
+                    row['error'] = feedback
+                else:
+                    row['status'] = 'ok'
+                    row['feedback'] = feedback
+            except Exception as e:
+                row['error'] = str(e)
+            row['latency_s'] = round(time.perf_counter() - start, 3)
+
+        self.writer.write(row)
+        with self._lock:
+            self.stats[row['status'] if row['status'] in DONE_STATUSES else 'failed'] += 1
+        print(f"[{row['status']}] {row['file']}")
+        return row
+
+    def run(self, input_dir: str, retry_unreadable: bool = False) -> Dict[str, int]:
+        paths = self.find_resumes(input_dir)
+        completed = self.writer.load_completed(('ok',) if retry_unreadable else DONE_STATUSES)
+        signatures = {path: file_signature(path) for path in paths}
+        pending = [path for path in paths if completed.get(path) != signatures[path]]
+        self.stats.update(found=len(paths), skipped=len(paths) - len(pending))
+        print(f"Found {len(paths)} resumes, {self.stats['skipped']} already reviewed or unreadable, {len(pending)} to go")
+
+        if not pending:
+            return self.stats
+
+        # Extraction is CPU-bound (PDF parsing) so it gets processes; LLM calls are
+        # I/O-bound and start as soon as each resume's text is ready.
+        with ProcessPoolExecutor(max_workers=self.extract_workers) as extract_pool, \
+                ThreadPoolExecutor(max_workers=self.concurrency) as llm_pool:
+            extract_futures = [extract_pool.submit(extract_text, path) for path in pending]
+            review_futures = []
+            for future in as_completed(extract_futures):
+                extracted = future.result()
+                review_futures.append(llm_pool.submit(self._review, extracted, signatures[extracted['file']]))
+            for future in review_futures:
+                future.result()
+
+        return self.stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate resume feedback for a directory of resumes")
+    parser.add_argument('input_dir', help="directory of .txt/.md/.pdf resumes")
+    parser.add_argument('--output', default='resume_feedback.jsonl', help="report path (.jsonl or .csv)")
+    parser.add_argument('--concurrency', type=int, default=4, help="LLM calls in flight at once")
+    parser.add_argument('--extract-workers', type=int, default=None, help="processes for text extraction")
+    parser.add_argument('--max-resume-tokens', type=int, default=1500, help="token budget per resume")
+    parser.add_argument('--retry-unreadable', action='store_true', help="re-extract unchanged files that had no readable text")
+    args = parser.parse_args(argv)
+
+    from groq_agent import GroqAgent
+    pipeline = ResumeBatchPipeline(PlacementAgent(GroqAgent()), args.output, args.concurrency,
+                                   args.extract_workers, args.max_resume_tokens)
+    stats = pipeline.run(args.input_dir, args.retry_unreadable)
+    print(f"\n✅ Reviewed {stats['ok']} resumes, ❌ {stats['failed']} failed, 📄 {stats['unreadable']} unreadable, "
+          f"⏭️ {stats['skipped']} skipped (already in {args.output})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import pandas as pd
+import numpy as np
+from typing import List, Dict, Any, Tuple, Union
+import os
+import threading
+import time
+
+# Binary text columns in the student datasets
+BINARY_VALUES = {'yes': 1.0, 'no': 0.0, 'placed': 1.0, 'not placed': 0.0, 'true': 1.0, 'false': 0.0}
+
+
+class SimilarityAgent:
+    """"Students like me" lookup over numeric student profiles.
+
+    Features are standardized once at load time and indexed with a KD-tree or
+    ball tree, so a single profile lookup only touches the tree and a few
+    NumPy rows. Distances only use the features a profile actually supplies:
+    partial profiles are answered from an index over that feature subset,
+    built on first use and kept for later lookups.
+    """
+
+    def __init__(self, file_path: str, outcome_column: str = 'Placement', features: List[str] = None,
+                 index_type: str = 'kd_tree', leaf_size: int = 40):
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found at {file_path}")
+
+        # Load data
+        if file_path.endswith('.csv'):
+            self.df = pd.read_csv(file_path)
+        elif file_path.endswith(('.xlsx', '.xls')):
+            self.df = pd.read_excel(file_path)
+        else:
+            raise ValueError(f"Unsupported file type: {file_path}")
+
+        if outcome_column not in self.df.columns:
+            raise ValueError(f"Outcome column '{outcome_column}' not found in {file_path}")
+
+        self.outcome_column = outcome_column
+        self.outcome = self._to_numeric(self.df[outcome_column]).to_numpy(dtype=float)
+        self.features = features or self._detect_features()
+
+        # Standardized feature matrix
+        raw = np.column_stack([self._to_numeric(self.df[col]).to_numpy(dtype=float) for col in self.features])
+        self.mean = np.nanmean(raw, axis=0)
+        self.std = np.nanstd(raw, axis=0)
+        self.std[self.std == 0] = 1.0
+        raw = np.where(np.isnan(raw), self.mean, raw)
+        self.matrix = (raw - self.mean) / self.std
+
+        # Nearest-neighbour index over all features; subset indexes are added on demand
+        from sklearn.neighbors import KDTree, BallTree
+        self.tree_class = BallTree if index_type == 'ball_tree' else KDTree
+        self.index_type = 'ball_tree' if index_type == 'ball_tree' else 'kd_tree'
+        self.leaf_size = leaf_size
+        self.tree = self.tree_class(self.matrix, leaf_size=leaf_size)
+        self.trees: Dict[Tuple[int, ...], Any] = {tuple(range(len(self.features))): self.tree}
+        self._tree_lock = threading.Lock()
+
+        # Pre-built records so lookups don't go through DataFrame.iloc
+        self.records = self.df.to_dict('records')
+
+        print(f"Indexed {len(self.df)} profiles on {len(self.features)} features with {self.index_type}")
+
+    def _detect_features(self) -> List[str]:
+        """Use numeric and yes/no columns, skipping the outcome and identifiers"""
+        features = []
+        for col in self.df.columns:
+            if col == self.outcome_column or col.lower() in ('id', 'name') or col.lower().endswith('_id'):
+                continue
+            if pd.api.types.is_numeric_dtype(self.df[col]) or self._is_binary(self.df[col]):
+                features.append(col)
+        return features
+
+    @staticmethod
+    def _is_binary(series: pd.Series) -> bool:
+        values = series.dropna().astype(str).str.strip().str.lower().unique()
+        return len(values) > 0 and all(value in BINARY_VALUES for value in values)
+
+    @staticmethod
+    def _to_numeric(series: pd.Series) -> pd.Series:
+        if pd.api.types.is_numeric_dtype(series):
+            return series.astype(float)
+        mapped = series.astype(str).str.strip().str.lower().map(BINARY_VALUES)
+        return mapped.fillna(pd.to_numeric(series, errors='coerce'))
+
+    def _tree_for(self, columns: Tuple[int, ...]):
+        """Index over a subset of the feature columns, built once per subset"""
+        with self._tree_lock:
+            tree = self.trees.get(columns)
+            if tree is None:
+                tree = self.tree_class(self.matrix[:, list(columns)], leaf_size=self.leaf_size)
+                self.trees[columns] = tree
+            return tree
+
+    def _profiles_to_matrix(self, profiles: Union[pd.DataFrame, List[Dict[str, Any]]]) -> np.ndarray:
+        """Standardize profiles; features a profile does not supply stay NaN"""
+        frame = profiles if isinstance(profiles, pd.DataFrame) else pd.DataFrame(list(profiles))
+        raw = np.full((len(frame), len(self.features)), np.nan)
+        for j, col in enumerate(self.features):
+            if col in frame.columns:
+                raw[:, j] = self._to_numeric(frame[col]).to_numpy(dtype=float)
+        return (raw - self.mean) / self.std
+
+    def _profile_to_vector(self, profile: Dict[str, Any]) -> np.ndarray:
+        vector = np.full(len(self.features), np.nan)
+        for j, col in enumerate(self.features):
+            value = profile.get(col)
+            if value is None:
+                continue
+            if isinstance(value, str):
+                value = BINARY_VALUES.get(value.strip().lower(), value)
+            try:
+                vector[j] = float(value)
+            except (TypeError, ValueError):
+                pass
+        return (vector - self.mean) / self.std
+
+    def similar_students(self, profile: Dict[str, Any], k: int = 10) -> Dict[str, Any]:
+        """Return the k most similar past students and their placement rate"""
+        k = max(1, min(k, len(self.records)))
+        start = time.perf_counter()
+        vector = self._profile_to_vector(profile)
+        columns = tuple(int(j) for j in np.flatnonzero(~np.isnan(vector)))
+        if not columns:
+            raise ValueError(f"Profile has none of the indexed features: {', '.join(self.features)}")
+
+        distances, indices = self._tree_for(columns).query(vector[list(columns)].reshape(1, -1), k=k)
+        distances, indices = distances[0], indices[0]
+        placement_rate = float(np.nanmean(self.outcome[indices])) * 100
+
+        neighbors = []
+        for distance, index in zip(distances, indices):
+            record = dict(self.records[index])
+            record['similarity_distance'] = round(float(distance), 4)
+            neighbors.append(record)
+
+        return {
+            'k': k,
+            'placement_rate': round(placement_rate, 1),
+            'neighbors': neighbors,
+            'features_used': [self.features[j] for j in columns],
+            'query_ms': round((time.perf_counter() - start) * 1000, 3),
+        }
+
+    def score_roster(self, roster: Union[pd.DataFrame, List[Dict[str, Any]]], k: int = 10) -> pd.DataFrame:
+        """Score a whole class roster with one vectorized tree query per feature subset.
+
+        Returns the roster with `similar_placement_rate` (percent of the k
+        nearest past students who were placed) and `mean_neighbor_distance`.
+        Students with none of the indexed features get NaN for both.
+        """
+        frame = roster.copy() if isinstance(roster, pd.DataFrame) else pd.DataFrame(list(roster))
+        if frame.empty:
+            return frame.assign(similar_placement_rate=[], mean_neighbor_distance=[])
+
+        k = max(1, min(k, len(self.records)))
+        matrix = self._profiles_to_matrix(frame)
+        present = ~np.isnan(matrix)
+        rates = np.full(len(frame), np.nan)
+        mean_distances = np.full(len(frame), np.nan)
+
+        # Students supplying the same features share one index and one query
+        patterns, groups = np.unique(present, axis=0, return_inverse=True)
+        for g, pattern in enumerate(patterns):
+            columns = tuple(int(j) for j in np.flatnonzero(pattern))
+            if not columns:
+                continue
+            rows = np.flatnonzero(groups.ravel() == g)
+            distances, indices = self._tree_for(columns).query(matrix[np.ix_(rows, list(columns))], k=k)
+            rates[rows] = np.nanmean(self.outcome[indices], axis=1) * 100
+            mean_distances[rows] = distances.mean(axis=1)
+
+        frame['similar_placement_rate'] = np.round(rates, 1)
+        frame['mean_neighbor_distance'] = np.round(mean_distances, 4)
+        return frame
+
+    def get_feature_summary(self) -> Dict[str, Any]:
+        return {
+            'total_profiles': len(self.records),
+            'features': self.features,
+            'index_type': self.index_type,
+            'overall_placement_rate': round(float(np.nanmean(self.outcome)) * 100, 1),
+            'feature_means': {col: round(float(mean), 2) for col, mean in zip(self.features, self.mean)},
+        }
@@ -0,0 +1,214 @@
+"""Startup profile and cold-start budget check.
+
+Imports each module in a fresh interpreter and reports its import time and
+resident memory cost, then checks that the modules main.py loads eagerly stay
+within the cold-start budget and do not drag in the heavy data backends.
+
+Usage:
+    python startup_profile.py                 # per-module report
+    python startup_profile.py --check         # exit 1 if the budget is exceeded
+    python startup_profile.py --importtime rag_agent   # top imports under a module
+"""
+
+from typing import Dict, List, Any
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def startup_modules(app_path: str = os.path.join(ROOT, 'main.py')) -> List[str]:
+    """Project modules imported at the top level of the app, i.e. before the first page render"""
+    with open(app_path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=app_path)
+
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            if os.path.exists(os.path.join(ROOT, name.split('.')[0] + '.py')) and name not in modules:
+                modules.append(name)
+    return modules
+
+
+# Modules main.py imports before the first page render, read from main.py itself
+STARTUP_MODULES = startup_modules()
+
+# Modules that are only loaded once a data mode (or the LLM client) is first used
+LAZY_MODULES = ['rag_agent', 'groq', 'pandas', 'sklearn.feature_extraction.text', 'sklearn.metrics.pairwise']
+
+# Backends that must never be pulled in by the startup imports
+HEAVY_MODULES = ['torch', 'sentence_transformers', 'sklearn', 'pandas', 'groq']
+
+# Cold-start budget for the startup imports in a fresh interpreter
+DEFAULT_BUDGET_MS = 500.0
+DEFAULT_BUDGET_RSS_MB = 40.0
+
+_PROBE = r'''
+import json, sys, time
+
+def rss_kb():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage // 1024 if sys.platform == 'darwin' else usage
+
+modules = sys.argv[1:]
+before_modules = set(sys.modules)
+rss_before = rss_kb()
+start = time.perf_counter()
+error = None
+try:
+    for name in modules:
+        __import__(name)
+except Exception as e:
+    error = f"{type(e).__name__}: {e}"
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    'import_ms': elapsed * 1000,
+    'rss_kb': rss_kb() - rss_before,
+    'new_modules': sorted(set(sys.modules) - before_modules),
+    'error': error,
+}))
+'''
+
+
+def probe(modules: List[str]) -> Dict[str, Any]:
+    """Import the given modules in a fresh interpreter and measure the cost"""
+    result = subprocess.run(
+        [sys.executable, '-c', _PROBE] + modules,
+        capture_output=True, text=True,
+        cwd=ROOT,
+    )
+    if result.returncode != 0 or not result.stdout.strip():
+        return {'import_ms': 0.0, 'rss_kb': 0, 'new_modules': [], 'error': result.stderr.strip()[-200:]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def importtime(module: str, top: int = 15) -> List[Dict[str, Any]]:
+    """Return the slowest imports (cumulative) under a module using -X importtime"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True,
+        cwd=ROOT,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        rows.append({
+            'module': parts[2].rstrip(),
+            'self_ms': int(parts[0]) / 1000,
+            'cumulative_ms': int(parts[1]) / 1000,
+        })
+    return sorted(rows, key=lambda row: row['cumulative_ms'], reverse=True)[:top]
+
+
+def profile(modules: List[str]) -> List[Dict[str, Any]]:
+    report = []
+    for name in modules:
+        result = probe([name])
+        report.append({
+            'module': name,
+            'import_ms': round(result['import_ms'], 1),
+            'rss_mb': round(result['rss_kb'] / 1024, 1),
+            'error': result['error'],
+        })
+    return report
+
+
+def check_budget(budget_ms: float, budget_rss_mb: float) -> Dict[str, Any]:
+    """Measure the startup imports together and compare against the budget"""
+    result = probe(STARTUP_MODULES)
+    loaded = set(result['new_modules'])
+    heavy = [name for name in HEAVY_MODULES if name in loaded]
+    import_ms = round(result['import_ms'], 1)
+    rss_mb = round(result['rss_kb'] / 1024, 1)
+
+    problems = []
+    if result['error']:
+        problems.append(f"startup import failed: {result['error']}")
+    if import_ms > budget_ms:
+        problems.append(f"cold start {import_ms} ms exceeds budget of {budget_ms} ms")
+    if rss_mb > budget_rss_mb:
+        problems.append(f"cold start RSS {rss_mb} MB exceeds budget of {budget_rss_mb} MB")
+    if heavy:
+        problems.append(f"heavy modules loaded at startup: {', '.join(heavy)}")
+
+    return {
+        'import_ms': import_ms,
+        'rss_mb': rss_mb,
+        'budget_ms': budget_ms,
+        'budget_rss_mb': budget_rss_mb,
+        'heavy_modules': heavy,
+        'problems': problems,
+        'passed': not problems,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Report import-time and RSS cost per module")
+    parser.add_argument('modules', nargs='*', help="modules to profile (default: startup and lazy modules)")
+    parser.add_argument('--check', action='store_true', help="exit non-zero if the cold-start budget is exceeded")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument('--budget-rss-mb', type=float, default=DEFAULT_BUDGET_RSS_MB)
+    parser.add_argument('--importtime', metavar='MODULE', help="show the slowest imports under MODULE")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.importtime:
+        rows = importtime(args.importtime)
+        if args.json:
+            print(json.dumps(rows, indent=2))
+        else:
+            print(f"\n⏱️ Slowest imports under {args.importtime}\n")
+            for row in rows:
+                print(f"• {row['module']}: {row['cumulative_ms']:.1f} ms cumulative ({row['self_ms']:.1f} ms self)")
+        return 0
+
+    report = profile(args.modules or STARTUP_MODULES + LAZY_MODULES)
+    budget = check_budget(args.budget_ms, args.budget_rss_mb)
+
+    if args.json:
+        print(json.dumps({'modules': report, 'cold_start': budget}, indent=2))
+    else:
+        print("\n🚀 Startup Profile (fresh interpreter per module)\n")
+        for row in report:
+            lazy = " (lazy)" if row['module'] in LAZY_MODULES else ""
+            if row['error']:
+                print(f"• {row['module']}{lazy}: not importable ({row['error']})")
+            else:
+                print(f"• {row['module']}{lazy}: {row['import_ms']} ms, +{row['rss_mb']} MB RSS")
+        print(f"\n📦 Cold start ({', '.join(STARTUP_MODULES)}): "
+              f"{budget['import_ms']} ms / {budget['budget_ms']} ms budget, "
+              f"+{budget['rss_mb']} MB / {budget['budget_rss_mb']} MB budget")
+        for problem in budget['problems']:
+            print(f"❌ {problem}")
+        if budget['passed']:
+            print("✅ Within budget")
+
+    if args.check and not budget['passed']:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+import pandas as pd
+import numpy as np
+from typing import List, Dict, Any, Tuple
+import os
+import re
+import threading
+
+from rag_agent import parse_ctc
+
+# Columns that may carry the date of a placement, in order of preference
+DATE_COLUMNS = ['date', 'offer date', 'drive date', 'placement date', 'month']
+UNKNOWN = 'Not specified'
+
+# What the year of a row means, by where it was read from
+PERIOD_LABELS = {
+    'date': 'Placement year',
+    'year column': 'Year',
+    'batch': 'Batch (cohort) year',
+    'sheet name': 'Sheet year',
+}
+
+# Rollup dimensions precomputed at load time and kept up to date on append
+ROLLUP_DIMENSIONS = [
+    ('year',),
+    ('year', 'month'),
+    ('year', 'company'),
+    ('year', 'program'),
+    ('year', 'month', 'company'),
+    ('year', 'month', 'program'),
+]
+
+
+def program_of(class_name: str) -> str:
+    """'MCA A' -> 'MCA', 'MSc AIML' -> 'MSc AIML' (drops the section letter)"""
+    return re.sub(r'\s+[A-Z]$', '', str(class_name).strip()) or UNKNOWN
+
+
+class TrendAgent:
+    """Time-aware placement analytics over a (multi-sheet) placement workbook.
+
+    Every sheet is parsed once into a small columnar store (one NumPy array per
+    field) and rolled up by year, month, company and program, so trend
+    questions are dictionary lookups. `append` and `refresh` fold new rows into
+    the rollups without re-reading what was already loaded.
+
+    Without a date column the year is the student's batch (cohort) year from
+    the registration number, not the year they were placed; `period_label`
+    says which one the trend rows use.
+    """
+
+    def __init__(self, file_path: str):
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found at {file_path}")
+
+        self.file_path = file_path
+        self.columns: Dict[str, np.ndarray] = {
+            'year': np.array([], dtype=int),
+            'month': np.array([], dtype=int),
+            'company': np.array([], dtype=object),
+            'program': np.array([], dtype=object),
+            'ctc': np.array([], dtype=float),
+            'placed': np.array([], dtype=bool),
+        }
+        # rollups[dimensions][key] = [records, placed, ctc_sum, ctc_count, ctc_max]
+        self.rollups: Dict[Tuple[str, ...], Dict[Tuple, List[float]]] = {dims: {} for dims in ROLLUP_DIMENSIONS}
+        self.rows_loaded: Dict[str, int] = {}
+        self.period_sources: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
+        self.data_version = self._data_version()
+        for sheet, frame in self._read_sheets().items():
+            self._append_sheet(sheet, frame)
+
+        years = sorted(set(self.columns['year'].tolist()) - {0})
+        print(f"Loaded {len(self.columns['year'])} placement records across years {years}")
+
+    def _data_version(self) -> str:
+        """Version of the workbook on disk (size + modification time)"""
+        stat = os.stat(self.file_path)
+        return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+    def _read_sheets(self) -> Dict[str, pd.DataFrame]:
+        if self.file_path.endswith('.csv'):
+            return {'csv': pd.read_csv(self.file_path)}
+        return pd.read_excel(self.file_path, sheet_name=None)
+
+    def _append_sheet(self, sheet: str, frame: pd.DataFrame):
+        start = self.rows_loaded.get(sheet, 0)
+        new_rows = frame.iloc[start:]
+        self.rows_loaded[sheet] = len(frame)
+        if len(new_rows):
+            self.append(new_rows, sheet_name=sheet)
+
+    def refresh(self) -> int:
+        """Re-read the workbook and fold in only the rows appended since the last load"""
+        with self._lock:
+            before = len(self.columns['year'])
+            self.data_version = self._data_version()
+            for sheet, frame in self._read_sheets().items():
+                self._append_sheet(sheet, frame)
+            return len(self.columns['year']) - before
+
+    def refresh_if_changed(self) -> int:
+        """Refresh when the workbook changed on disk since the last load; returns rows added"""
+        try:
+            current = self._data_version()
+        except OSError:
+            return 0
+        if current == self.data_version:
+            return 0
+        with self._lock:
+            if current == self.data_version:
+                return 0
+            print(f"Data file changed, refreshing trends from {self.file_path}")
+            return self.refresh()
+
+    def append(self, frame: pd.DataFrame, sheet_name: str = '') -> int:
+        """Add new placement rows to the columnar store and update the rollups incrementally"""
+        if frame.empty:
+            return 0
+
+        new, source = self._to_columns(frame, sheet_name)
+        frame_new = pd.DataFrame(new)
+        frame_new['ctc_value'] = frame_new['ctc'].fillna(0.0)
+        frame_new['ctc_count'] = frame_new['ctc'].notna().astype(int)
+        groups = {dims: frame_new.groupby(list(dims), sort=False).agg(
+                records=('placed', 'size'),
+                placed=('placed', 'sum'),
+                ctc_sum=('ctc_value', 'sum'),
+                ctc_count=('ctc_count', 'sum'),
+                ctc_max=('ctc', 'max'),
+            ) for dims in ROLLUP_DIMENSIONS}
+
+        with self._lock:
+            for name, values in new.items():
+                self.columns[name] = np.concatenate([self.columns[name], values])
+            self.period_sources[sheet_name] = source
+            for dims, grouped in groups.items():
+                rollup = self.rollups[dims]
+                for key, row in grouped.iterrows():
+                    key = key if isinstance(key, tuple) else (key,)
+                    self._merge(rollup.setdefault(key, [0, 0, 0.0, 0, np.nan]),
+                                [int(row['records']), int(row['placed']), float(row['ctc_sum']),
+                                 int(row['ctc_count']), float(row['ctc_max'])])
+        return len(frame_new)
+
+    def _to_columns(self, frame: pd.DataFrame, sheet_name: str) -> Tuple[Dict[str, np.ndarray], str]:
+        year, month, source = self._extract_periods(frame, sheet_name)
+
+        company = frame['Company'] if 'Company' in frame.columns else pd.Series(UNKNOWN, index=frame.index)
+        company = company.fillna(UNKNOWN).astype(str).str.strip().replace({'': UNKNOWN, '-': UNKNOWN})
+        program = frame['Class'].map(program_of) if 'Class' in frame.columns else pd.Series(UNKNOWN, index=frame.index)
+        ctc = frame['Compensation: CTC'].map(parse_ctc) if 'Compensation: CTC' in frame.columns \
+            else pd.Series(np.nan, index=frame.index)
+
+        return {
+            'year': year,
+            'month': month,
+            'company': company.to_numpy(dtype=object),
+            'program': program.fillna(UNKNOWN).to_numpy(dtype=object),
+            'ctc': ctc.to_numpy(dtype=float),
+            'placed': (company != UNKNOWN).to_numpy(dtype=bool),
+        }, source
+
+    def _extract_periods(self, frame: pd.DataFrame, sheet_name: str) -> Tuple[np.ndarray, np.ndarray, str]:
+        """Year and month per row (0 when unknown), and where the year came from.
+
+        Uses a date-like column when there is one, otherwise a year column,
+        otherwise the batch year encoded in the registration number
+        (2347203 -> 2023), otherwise a year in the sheet name.
+        """
+        n = len(frame)
+        lower_columns = {col.lower().strip(): col for col in frame.columns}
+
+        for name in DATE_COLUMNS:
+            if name in lower_columns:
+                dates = pd.to_datetime(frame[lower_columns[name]], errors='coerce')
+                if dates.notna().any():
+                    return (dates.dt.year.fillna(0).astype(int).to_numpy(),
+                            dates.dt.month.fillna(0).astype(int).to_numpy(), 'date')
+
+        year = np.zeros(n, dtype=int)
+        source = 'sheet name'
+        if 'year' in lower_columns:
+            year = pd.to_numeric(frame[lower_columns['year']], errors='coerce').fillna(0).astype(int).to_numpy()
+            source = 'year column'
+        elif 'Registration Number' in frame.columns:
+            prefix = frame['Registration Number'].astype(str).str.extract(r'^(\d{2})\d{3,}', expand=False)
+            year = (pd.to_numeric(prefix, errors='coerce') + 2000).fillna(0).astype(int).to_numpy()
+            source = 'batch'
+
+        sheet_year = re.search(r'(20\d{2})', sheet_name or '')
+        if sheet_year:
+            year = np.where(year == 0, int(sheet_year.group(1)), year)
+        return year, np.zeros(n, dtype=int), source
+
+    def period_label(self) -> str:
+        """What the trend periods mean, e.g. 'Placement year' or 'Batch (cohort) year'"""
+        with self._lock:
+            labels = sorted({PERIOD_LABELS[source] for source in self.period_sources.values()})
+        if len(labels) == 1:
+            return labels[0]
+        return f"Year ({', '.join(label.lower() for label in labels)})" if labels else 'Year'
+
+    def _lookup(self, by: Tuple[str, ...], program: str = None, company: str = None) -> Dict[Tuple, List[float]]:
+        """Aggregates per period, filtered by program/company, from the precomputed rollups"""
+        if program and company:
+            return self._scan(by, program, company)
+
+        if program or company:
+            field, value = ('program', program) if program else ('company', company)
+            rollup = self.rollups[by + (field,)]
+            value = value.lower()
+            result: Dict[Tuple, List[float]] = {}
+            for key, entry in rollup.items():
+                if value in str(key[-1]).lower():
+                    self._merge(result.setdefault(key[:-1], [0, 0, 0.0, 0, np.nan]), entry)
+            return result
+
+        return self.rollups[by]
+
+    def _scan(self, by: Tuple[str, ...], program: str, company: str) -> Dict[Tuple, List[float]]:
+        """Fallback for filter combinations that have no rollup: a row-by-row scan of the columns"""
+        mask = np.array([program.lower() in str(p).lower() for p in self.columns['program']], dtype=bool)
+        mask &= np.array([company.lower() in str(c).lower() for c in self.columns['company']], dtype=bool)
+        result: Dict[Tuple, List[float]] = {}
+        for i in np.flatnonzero(mask):
+            key = tuple(int(self.columns[field][i]) for field in by)
+            ctc = float(self.columns['ctc'][i])
+            has_ctc = not np.isnan(ctc)
+            self._merge(result.setdefault(key, [0, 0, 0.0, 0, np.nan]),
+                        [1, int(self.columns['placed'][i]), ctc if has_ctc else 0.0, int(has_ctc), ctc])
+        return result
+
+    @staticmethod
+    def _merge(target: List[float], entry: List[float]):
+        target[0] += entry[0]
+        target[1] += entry[1]
+        target[2] += entry[2]
+        target[3] += entry[3]
+        if not np.isnan(entry[4]):
+            target[4] = entry[4] if np.isnan(target[4]) else max(target[4], entry[4])
+
+    def trend(self, by: str = 'year', program: str = None, company: str = None) -> List[Dict[str, Any]]:
+        """Placements and CTC per year (or year-month) with growth over the previous period"""
+        dims = ('year', 'month') if by == 'month' else ('year',)
+        period_label = self.period_label()
+        with self._lock:
+            periods = sorted((key, list(entry)) for key, entry in self._lookup(dims, program, company).items())
+
+        rows = []
+        previous = None
+        for key, (records, placed, ctc_sum, ctc_count, ctc_max) in periods:
+            if key[0] == 0 or (by == 'month' and key[1] == 0):
+                continue  # rows without a usable date
+            average_ctc = round(float(ctc_sum) / ctc_count, 2) if ctc_count else None
+            row = {
+                'period': f"{key[0]}-{key[1]:02d}" if by == 'month' else str(key[0]),
+                'period_label': period_label,
+                'records': records,
+                'placements': placed,
+                'average_ctc': average_ctc,
+                'highest_ctc': None if np.isnan(ctc_max) else round(float(ctc_max), 2),
+                'placement_growth': None,
+                'ctc_growth': None,
+            }
+            if previous:
+                if previous['placements']:
+                    row['placement_growth'] = round((placed - previous['placements']) / previous['placements'] * 100, 1)
+                if previous['average_ctc'] and average_ctc is not None:
+                    row['ctc_growth'] = round((average_ctc - previous['average_ctc']) / previous['average_ctc'] * 100, 1)
+            rows.append(row)
+            previous = row
+        return rows
+
+    def placements_by_year(self, program: str = None, company: str = None) -> List[Dict[str, Any]]:
+        return self.trend('year', program, company)
+
+    def ctc_growth(self, program: str = None, company: str = None) -> List[Dict[str, Any]]:
+        return [{key: row[key] for key in ('period', 'period_label', 'average_ctc', 'highest_ctc', 'ctc_growth')}
+                for row in self.trend('year', program, company)]
+
+    def top_companies(self, year: int = None, n: int = 5) -> List[Dict[str, Any]]:
+        totals: Dict[str, int] = {}
+        with self._lock:
+            for (entry_year, company), entry in self.rollups[('year', 'company')].items():
+                if company != UNKNOWN and (year is None or entry_year == year):
+                    totals[company] = totals.get(company, 0) + entry[1]
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:n]
+        return [{'company': company, 'placements': count} for company, count in ranked]
+
+    def get_years(self) -> List[int]:
+        with self._lock:
+            return sorted(key[0] for key in self.rollups[('year',)] if key[0] != 0)
+
+    def get_programs(self) -> List[str]:
+        with self._lock:
+            return sorted({key[1] for key in self.rollups[('year', 'program')]} - {UNKNOWN})
+
+    def has_monthly_data(self) -> bool:
+        with self._lock:
+            return any(key[1] != 0 for key in self.rollups[('year', 'month')])
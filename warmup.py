@@ -0,0 +1,90 @@
+"""Offline pre-generation of roadmaps, skill lists and interview banks.
+
+Enumerates the distinct companies, roles and (company, role) pairs in a
+placement data file and generates the CareerAgent/PlacementAgent artifacts for
+each of them concurrently, storing the results in the local ArtifactStore. The
+agents then serve these instantly and only call the LLM for unseen inputs.
+
+Usage:
+    python warmup.py data/knowledge.csv --concurrency 4
+"""
+
+from typing import Dict, List, Any, Callable, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import argparse
+import time
+
+from artifact_store import ArtifactStore, DEFAULT_STORE_PATH
+from career_agent import CareerAgent
+from groq_agent import GENERATION_ERROR_PREFIX
+from placement_agent import PlacementAgent
+
+
+def build_jobs(rag_agent, career_agent: CareerAgent, placement_agent: PlacementAgent) -> List[Tuple[str, tuple, Callable[[], str]]]:
+    """(kind, key parts, generator) for every artifact the data calls for"""
+    stats = rag_agent.get_stats()
+    roles = sorted({str(role).strip() for role in stats['roles'] if str(role).strip() not in ('', 'Not specified')})
+
+    jobs = []
+    for role in roles:
+        jobs.append(('roadmap', (role,), lambda role=role: career_agent.roadmap(role)))
+        jobs.append(('skills', (role,), lambda role=role: career_agent.suggest_skills(role)))
+    for pair in rag_agent.get_company_role_pairs():
+        company, role = pair['company'], pair['role']
+        jobs.append(('interview', (company, role),
+                     lambda company=company, role=role: placement_agent.interview_questions(company, role)))
+    return jobs
+
+
+def warm_up(rag_agent, groq_agent, store: ArtifactStore, concurrency: int = 4, refresh: bool = False) -> Dict[str, Any]:
+    # Agents without a store always generate live; results are written here
+    career_agent = CareerAgent(groq_agent)
+    placement_agent = PlacementAgent(groq_agent)
+
+    jobs = build_jobs(rag_agent, career_agent, placement_agent)
+    pending = [job for job in jobs if refresh or not store.contains(job[0], *job[1])]
+    stats = {'total': len(jobs), 'skipped': len(jobs) - len(pending), 'generated': 0, 'failed': 0}
+    print(f"{len(jobs)} artifacts for this data, {stats['skipped']} already stored, {len(pending)} to generate")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {pool.submit(generate): (kind, parts) for kind, parts, generate in pending}
+        for future in as_completed(futures):
+            kind, parts = futures[future]
+            try:
+                response = future.result()
+            except Exception as e:
+                response = f"{GENERATION_ERROR_PREFIX} Error: {e}"
+            if response.startswith(GENERATION_ERROR_PREFIX):
+                stats['failed'] += 1
+                print(f"[failed] {kind}: {' @ '.join(parts)}")
+            else:
+                store.put(kind, *parts, value=response)
+                stats['generated'] += 1
+                print(f"[ok] {kind}: {' @ '.join(parts)}")
+
+    stats['elapsed_s'] = round(time.perf_counter() - start, 2)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-generate roadmaps, skills and interview banks for the data")
+    parser.add_argument('data_file', help="placement data file (csv/xlsx)")
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH, help="artifact store path")
+    parser.add_argument('--concurrency', type=int, default=4, help="LLM calls in flight at once")
+    parser.add_argument('--refresh', action='store_true', help="regenerate artifacts that are already stored")
+    args = parser.parse_args(argv)
+
+    from groq_agent import GroqAgent
+    from rag_agent import RAGAgent
+
+    store = ArtifactStore(args.store)
+    stats = warm_up(RAGAgent(args.data_file), GroqAgent(), store, args.concurrency, args.refresh)
+    print(f"\n✅ Generated {stats['generated']}, ❌ {stats['failed']} failed, "
+          f"⏭️ {stats['skipped']} already stored in {stats['elapsed_s']} s "
+          f"({store.count()} artifacts in {args.store})")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()